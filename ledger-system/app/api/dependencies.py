@@ -0,0 +1,15 @@
+from fastapi import Request
+from app.services.ledger_service import LedgerService
+
+def get_ledger_service(request: Request) -> LedgerService:
+    """Return the process-wide LedgerService.
+
+    Normally created once in the lifespan handler; created lazily here
+    when the app runs without lifespan (e.g. httpx.ASGITransport in
+    tests, which never triggers startup events).
+    """
+    service = getattr(request.app.state, 'ledger_service', None)
+    if service is None:
+        service = LedgerService()
+        request.app.state.ledger_service = service
+    return service
@@ -1,14 +1,17 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from uuid import UUID
 from app.models.account import Account, AccountCreate
 from app.models.balance import Balance
 from app.services.ledger_service import LedgerService
+from app.api.dependencies import get_ledger_service
 
 router = APIRouter(prefix="/account", tags=["accounts"])
-ledger_service = LedgerService()
 
 @router.post("/", response_model=Account)
-async def create_account(account_data: AccountCreate):
+async def create_account(
+    account_data: AccountCreate,
+    ledger_service: LedgerService = Depends(get_ledger_service)
+):
     """Create a new account"""
     try:
         return await ledger_service.create_account(account_data)
@@ -16,11 +19,28 @@ async def create_account(account_data: AccountCreate):
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{account_id}/balance", response_model=Balance)
-async def get_account_balance(account_id: UUID):
+async def get_account_balance(
+    account_id: UUID,
+    ledger_service: LedgerService = Depends(get_ledger_service)
+):
     """Get account balance"""
     try:
         return await ledger_service.get_account_balance(account_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/{account_id}/snapshot")
+async def get_account_snapshot(
+    account_id: UUID,
+    limit: int = Query(100, ge=1, le=1000, description="Number of events to return"),
+    ledger_service: LedgerService = Depends(get_ledger_service)
+):
+    """Get current balance and recent events in a single request"""
+    try:
+        return await ledger_service.get_account_snapshot(account_id, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,19 +1,21 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 from app.models.event import LedgerEvent
 from app.services.ledger_service import LedgerService
+from app.api.dependencies import get_ledger_service
 
 router = APIRouter(prefix="/events", tags=["events"])
-ledger_service = LedgerService()
 
 @router.get("/", response_model=List[LedgerEvent])
 async def get_events(
     account_id: UUID = Query(..., description="Account ID to get events for"),
-    limit: int = Query(100, ge=1, le=1000, description="Number of events to return")
+    limit: int = Query(100, ge=1, le=1000, description="Number of events to return"),
+    event_type: Optional[str] = Query(None, description="Filter by event type (DEBIT/CREDIT)"),
+    ledger_service: LedgerService = Depends(get_ledger_service)
 ):
     """Get events for an account"""
     try:
-        return await ledger_service.get_account_events(account_id, limit)
+        return await ledger_service.get_account_events(account_id, limit, event_type)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
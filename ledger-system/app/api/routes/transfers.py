@@ -1,22 +1,25 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from app.models.event import TransferRequest
 from app.services.ledger_service import LedgerService
+from app.api.dependencies import get_ledger_service
 
 router = APIRouter(prefix="/transfer", tags=["transfers"])
-ledger_service = LedgerService()
 
 @router.post("/")
-async def transfer_funds(transfer: TransferRequest):
+async def transfer_funds(
+    transfer: TransferRequest,
+    ledger_service: LedgerService = Depends(get_ledger_service)
+):
     """Transfer funds between accounts"""
     try:
         result = await ledger_service.transfer_funds(transfer)
-        
+
         if not result['success']:
             raise HTTPException(status_code=400, detail={
                 'message': 'Transfer failed',
                 'errors': result['errors']
             })
-        
+
         return {
             'message': 'Transfer successful',
             'transaction_id': result['transaction_id'],
@@ -25,4 +28,4 @@ async def transfer_funds(transfer: TransferRequest):
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,43 +1,105 @@
 import asyncpg
+import os
 from contextlib import asynccontextmanager
 from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+class LedgerRecord(asyncpg.Record):
+    """Record with attribute access so Pydantic models can validate rows
+    directly via from_attributes, without materializing a dict per row"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
 class DatabaseManager:
+    """Owns the asyncpg pool shared by all repositories.
+
+    Pool connections run with synchronous_commit=off: commits return
+    before the WAL fsync, which removes the per-commit fsync wait on the
+    append-only event path at the cost of a small window of committed
+    transactions that could be lost on a server crash. Statements that
+    need strict durability can opt back in with
+    SET LOCAL synchronous_commit = on.
+    """
+
+    # Hot queries registered by the repositories at import time. The
+    # registry is class-level and shared: however many repository or
+    # service instances exist, each pool connection prepares every
+    # statement exactly once.
+    _statements = {}
+
     def __init__(self):
         self.pool = None
-    
+
+    @classmethod
+    def register_statement(cls, name: str, query: str):
+        """Register a hot query to be prepared on each pool connection.
+
+        Must happen at import time, before the pool exists; connections
+        created earlier would silently miss the statement.
+        """
+        existing = cls._statements.get(name)
+        if existing is not None and existing != query:
+            raise ValueError(f"Conflicting SQL registered for statement '{name}'")
+        cls._statements[name] = query
+
+    async def _init_connection(self, conn):
+        """One-time setup for a new physical pool connection.
+
+        Applies session settings (see class docstring) and prepares all
+        registered hot queries. Session-level SET survives for the
+        connection's lifetime, so it belongs here, not in the setup=
+        hook that runs on every acquire().
+        """
+        await conn.execute("SET synchronous_commit = off")
+        conn._ledger_stmts = {
+            name: await conn.prepare(query)
+            for name, query in self._statements.items()
+        }
+
     async def connect(self):
         """Create database connection pool"""
+        # Size the pool from the core count (2 * cores + 1) unless
+        # explicitly overridden; recycle idle and long-lived connections
+        max_size = settings.db_pool_max or (os.cpu_count() or 4) * 2 + 1
         try:
             self.pool = await asyncpg.create_pool(
                 settings.database_url,
-                min_size=5,
-                max_size=20,
-                command_timeout=60
+                min_size=max(2, max_size // 4),
+                max_size=max_size,
+                max_inactive_connection_lifetime=600,
+                max_queries=50000,
+                command_timeout=60,
+                statement_cache_size=1024,
+                server_settings={'jit': 'off', 'application_name': 'ledger'},
+                record_class=LedgerRecord,
+                init=self._init_connection
             )
             logger.info("Database connection pool created")
         except Exception as e:
             logger.error(f"Failed to create database pool: {e}")
             raise
-    
+
     async def disconnect(self):
         """Close database connection pool"""
         if self.pool:
             await self.pool.close()
             logger.info("Database connection pool closed")
-    
+
     @asynccontextmanager
     async def get_connection(self):
         """Get database connection from pool"""
         if not self.pool:
             await self.connect()
-        
+
         async with self.pool.acquire() as connection:
             yield connection
-    
+
     @asynccontextmanager
     async def get_transaction(self):
         """Get database transaction"""
@@ -46,4 +108,4 @@ class DatabaseManager:
                 yield conn
 
 # Global database manager instance
-db_manager = DatabaseManager()
\ No newline at end of file
+db_manager = DatabaseManager()
@@ -0,0 +1,16 @@
+-- Account history scans: the OR across source/destination defeats a
+-- single btree, so give each side its own ordered partial index and let
+-- the query merge the two streams (see GET_EVENTS_BY_ACCOUNT).
+-- INCLUDE carries the hot scalar columns so the arms stay index-only
+-- until the heap fetch for metadata.
+CREATE INDEX ledger_events_src_ts ON ledger_events (source_account_id, timestamp DESC)
+    INCLUDE (id, destination_account_id, amount, currency, event_type, transaction_id, status)
+    WHERE source_account_id IS NOT NULL;
+
+CREATE INDEX ledger_events_dst_ts ON ledger_events (destination_account_id, timestamp DESC)
+    INCLUDE (id, source_account_id, amount, currency, event_type, transaction_id, status)
+    WHERE destination_account_id IS NOT NULL;
+
+-- Superseded by the composite indexes above
+DROP INDEX IF EXISTS idx_ledger_events_account_id;
+DROP INDEX IF EXISTS idx_ledger_events_destination_id;
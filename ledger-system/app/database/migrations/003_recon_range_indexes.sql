@@ -0,0 +1,8 @@
+-- Reconciliation range scans: DATE(timestamp) predicates are not
+-- sargable against the plain timestamp btree, so every day load and
+-- amount-range probe was a full-day seq scan. The expression index
+-- serves the DATE(timestamp) = $1 day loads; the plain composite serves
+-- the rewritten half-open range + currency + amount queries.
+CREATE INDEX ledger_events_day_ccy_amt ON ledger_events ((timestamp::date), currency, amount);
+
+CREATE INDEX ledger_events_ts_ccy_amt ON ledger_events (timestamp, currency, amount);
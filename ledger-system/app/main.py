@@ -1,10 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
 
 from app.config import settings
 from app.database.connection import db_manager
+from app.services.ledger_service import LedgerService
 from app.api.routes import accounts, transfers, events
 
 # Configure logging
@@ -16,6 +19,7 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up ledger service")
     await db_manager.connect()
+    app.state.ledger_service = LedgerService()
     yield
     # Shutdown
     logger.info("Shutting down ledger service")
@@ -25,18 +29,24 @@ app = FastAPI(
     title="Event-Sourced Ledger System",
     description="A double-entry, event-sourced ledger system with REST APIs",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes UUID/datetime-heavy event lists in C
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Event-list responses are repetitive JSON that compresses roughly 10x;
+# skip the small health/balance payloads
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(accounts.router, prefix="/ledger")
 app.include_router(transfers.router, prefix="/ledger")
@@ -50,11 +60,15 @@ async def root():
 async def health_check():
     return {"status": "healthy", "service": "ledger-system"}
 
+# For production, run multiple workers behind gunicorn instead:
+#   gunicorn -k uvicorn.workers.UvicornWorker -w $((2 * $(nproc) + 1)) app.main:app
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
         "app.main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=True
+        loop="uvloop",
+        http="httptools",
+        reload=False
     )
\ No newline at end of file
@@ -1,43 +1,125 @@
 from uuid import UUID
 from typing import Optional
+from cachetools import TTLCache
 from app.models.account import Account, AccountCreate
 from app.database.connection import db_manager
 import asyncpg
 
+# Account rows are created once and their currency never changes, so a
+# short TTL covers the rare metadata edit while skipping the per-transfer
+# validation SELECT for accounts seen recently. Shared across repository
+# instances so every caller benefits from the same warm entries.
+_account_cache = TTLCache(maxsize=100_000, ttl=300)
+
+CREATE_ACCOUNT = """
+    INSERT INTO accounts (currency, type, metadata)
+    VALUES ($1, $2, $3)
+    RETURNING id, currency, type, metadata, created_at, updated_at
+"""
+
+GET_ACCOUNT = """
+    SELECT id, currency, type, metadata, created_at, updated_at
+    FROM accounts
+    WHERE id = $1
+"""
+
+ACCOUNT_EXISTS = "SELECT 1 FROM accounts WHERE id = $1"
+
+GET_CURRENCIES_BY_IDS = """
+    SELECT id, currency
+    FROM accounts
+    WHERE id = ANY($1::uuid[])
+"""
+
+db_manager.register_statement('create_account', CREATE_ACCOUNT)
+db_manager.register_statement('get_account', GET_ACCOUNT)
+db_manager.register_statement('account_exists', ACCOUNT_EXISTS)
+db_manager.register_statement('get_currencies_by_ids', GET_CURRENCIES_BY_IDS)
+
 class AccountRepository:
+    # Read methods accept an optional conn so a request that already
+    # holds a connection (e.g. the transfer transaction) can reuse it
+    # instead of paying another pool acquire.
+
     async def create(self, account_data: AccountCreate) -> Account:
         """Create a new account"""
-        query = """
-            INSERT INTO accounts (currency, type, metadata)
-            VALUES ($1, $2, $3)
-            RETURNING id, currency, type, metadata, created_at, updated_at
-        """
-        
         async with db_manager.get_connection() as conn:
-            row = await conn.fetchrow(
-                query,
+            stmt = conn._ledger_stmts['create_account']
+            row = await stmt.fetchrow(
                 account_data.currency,
                 account_data.type,
                 account_data.metadata
             )
-            return Account(**dict(row))
-    
-    async def get_by_id(self, account_id: UUID) -> Optional[Account]:
+            account = Account.model_validate(row, from_attributes=True)
+            _account_cache[account.id] = account
+            return account
+
+    async def get_by_id(self, account_id: UUID, conn=None) -> Optional[Account]:
         """Get account by ID"""
-        query = """
-            SELECT id, currency, type, metadata, created_at, updated_at
-            FROM accounts
-            WHERE id = $1
+        cached = _account_cache.get(account_id)
+        if cached is not None:
+            return cached
+
+        if conn is not None:
+            return await self._fetch_by_id(conn, account_id)
+
+        async with db_manager.get_connection() as conn:
+            return await self._fetch_by_id(conn, account_id)
+
+    async def _fetch_by_id(self, conn, account_id: UUID) -> Optional[Account]:
+        stmt = conn._ledger_stmts['get_account']
+        row = await stmt.fetchrow(account_id)
+        if not row:
+            return None
+        account = Account.model_validate(row, from_attributes=True)
+        _account_cache[account_id] = account
+        return account
+
+    async def get_currencies_by_ids(self, account_ids: list, conn=None) -> dict:
+        """Get currency per account for a set of IDs in one round-trip.
+
+        Missing accounts are simply absent from the returned mapping.
+        Cached accounts are answered locally; only cache misses hit the
+        database.
         """
-        
+        currencies = {}
+        missing = []
+        for account_id in account_ids:
+            cached = _account_cache.get(account_id)
+            if cached is not None:
+                currencies[account_id] = cached.currency
+            else:
+                missing.append(account_id)
+
+        if not missing:
+            return currencies
+
+        if conn is not None:
+            return await self._fetch_currencies(conn, missing, currencies)
+
         async with db_manager.get_connection() as conn:
-            row = await conn.fetchrow(query, account_id)
-            return Account(**dict(row)) if row else None
-    
-    async def exists(self, account_id: UUID) -> bool:
-        """Check if account exists"""
-        query = "SELECT 1 FROM accounts WHERE id = $1"
-        
+            return await self._fetch_currencies(conn, missing, currencies)
+
+    async def _fetch_currencies(self, conn, missing: list, currencies: dict) -> dict:
+        stmt = conn._ledger_stmts['get_currencies_by_ids']
+        rows = await stmt.fetch(missing)
+        for row in rows:
+            currencies[row['id']] = row['currency']
+        return currencies
+
+    async def exists(self, account_id: UUID, conn=None) -> bool:
+        """Check if account exists.
+
+        Not used on the transfer validation path -- that goes through
+        get_currencies_by_ids, which answers existence and currency for
+        both accounts in one round-trip. Keep this only for callers that
+        genuinely need a bare boolean.
+        """
+        if conn is not None:
+            result = await conn._ledger_stmts['account_exists'].fetchval(account_id)
+            return result is not None
+
         async with db_manager.get_connection() as conn:
-            result = await conn.fetchval(query, account_id)
-            return result is not None
\ No newline at end of file
+            stmt = conn._ledger_stmts['account_exists']
+            result = await stmt.fetchval(account_id)
+            return result is not None
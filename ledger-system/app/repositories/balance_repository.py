@@ -4,52 +4,169 @@ from app.models.balance import Balance
 from app.database.connection import db_manager
 from decimal import Decimal
 
+GET_BALANCE = """
+    SELECT account_id, currency, available_balance, pending_balance,
+           last_updated, version
+    FROM balances
+    WHERE account_id = $1
+"""
+
+UPSERT_BALANCE = """
+    INSERT INTO balances (account_id, currency, available_balance, pending_balance)
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT (account_id)
+    DO UPDATE SET
+        available_balance = balances.available_balance + $3,
+        pending_balance = balances.pending_balance + $4,
+        last_updated = NOW(),
+        version = balances.version + 1
+    RETURNING account_id, currency, available_balance, pending_balance,
+             last_updated, version
+"""
+
+UPSERT_BALANCE_PAIR = """
+    INSERT INTO balances (account_id, currency, available_balance, pending_balance)
+    VALUES ($1, $3, $2, 0), ($4, $3, $5, 0)
+    ON CONFLICT (account_id)
+    DO UPDATE SET
+        available_balance = balances.available_balance + EXCLUDED.available_balance,
+        last_updated = NOW(),
+        version = balances.version + 1
+    RETURNING account_id, currency, available_balance, pending_balance,
+             last_updated, version
+"""
+
+GET_BALANCES = """
+    SELECT account_id, currency, available_balance, pending_balance,
+           last_updated, version
+    FROM balances
+    WHERE account_id = ANY($1::uuid[])
+"""
+
+CHECK_SUFFICIENT_FUNDS = """
+    SELECT available_balance
+    FROM balances
+    WHERE account_id = $1
+"""
+
+# Guarded debit: the funds predicate rides on the UPDATE itself, so there
+# is no read-then-write window on hot accounts. Zero rows returned means
+# missing balance or insufficient funds. Lookup is via the balances
+# primary key, so no extra index is needed.
+DEBIT_IF_SUFFICIENT = """
+    UPDATE balances
+    SET available_balance = available_balance - $2,
+        last_updated = NOW(),
+        version = version + 1
+    WHERE account_id = $1
+      AND (available_balance >= $2 OR $3)
+    RETURNING account_id, currency, available_balance, pending_balance,
+             last_updated, version
+"""
+
+db_manager.register_statement('get_balance', GET_BALANCE)
+db_manager.register_statement('get_balances', GET_BALANCES)
+db_manager.register_statement('upsert_balance', UPSERT_BALANCE)
+db_manager.register_statement('upsert_balance_pair', UPSERT_BALANCE_PAIR)
+db_manager.register_statement('check_sufficient_funds', CHECK_SUFFICIENT_FUNDS)
+db_manager.register_statement('debit_if_sufficient', DEBIT_IF_SUFFICIENT)
+
 class BalanceRepository:
     async def get_balance(self, account_id: UUID) -> Optional[Balance]:
         """Get current balance for an account"""
-        query = """
-            SELECT account_id, currency, available_balance, pending_balance,
-                   last_updated, version
-            FROM balances
-            WHERE account_id = $1
+        async with db_manager.get_connection() as conn:
+            stmt = conn._ledger_stmts['get_balance']
+            row = await stmt.fetchrow(account_id)
+            return Balance.model_validate(row, from_attributes=True) if row else None
+
+    async def get_balances(self, account_ids: list) -> dict:
+        """Get balances for several accounts in one round-trip.
+
+        Returns a mapping keyed by account id; missing accounts are
+        simply absent.
         """
-        
         async with db_manager.get_connection() as conn:
-            row = await conn.fetchrow(query, account_id)
-            return Balance(**dict(row)) if row else None
-    
-    async def upsert_balance(self, conn, account_id: UUID, currency: str, 
+            stmt = conn._ledger_stmts['get_balances']
+            rows = await stmt.fetch(account_ids)
+            return {
+                row['account_id']: Balance.model_validate(row, from_attributes=True)
+                for row in rows
+            }
+
+    async def upsert_balance(self, conn, account_id: UUID, currency: str,
                            available_delta: Decimal = Decimal('0'),
                            pending_delta: Decimal = Decimal('0')):
         """Update or insert balance atomically"""
-        query = """
+        stmt = conn._ledger_stmts['upsert_balance']
+        row = await stmt.fetchrow(
+            account_id, currency, available_delta, pending_delta
+        )
+        return Balance.model_validate(row, from_attributes=True)
+
+    async def upsert_two(self, conn, source_account_id: UUID, source_delta: Decimal,
+                       destination_account_id: UUID, destination_delta: Decimal,
+                       currency: str):
+        """Apply deltas to two accounts in a single multi-row upsert"""
+        stmt = conn._ledger_stmts['upsert_balance_pair']
+        rows = await stmt.fetch(
+            source_account_id, source_delta, currency,
+            destination_account_id, destination_delta
+        )
+        return [Balance.model_validate(row, from_attributes=True) for row in rows]
+
+    async def upsert_many(self, conn, deltas):
+        """Apply available-balance deltas to any number of accounts at once.
+
+        ``deltas`` is a list of (account_id, currency, available_delta)
+        tuples. Built dynamically like create_events_bulk because the row
+        count varies; one round-trip regardless of how many accounts a
+        transaction touched.
+        """
+        values_clauses = []
+        flat_args = []
+        for i, (account_id, currency, available_delta) in enumerate(deltas):
+            offset = i * 3
+            values_clauses.append(
+                f"(${offset + 1}::uuid, ${offset + 2}, ${offset + 3}::numeric, 0)"
+            )
+            flat_args.extend([account_id, currency, available_delta])
+
+        query = f"""
             INSERT INTO balances (account_id, currency, available_balance, pending_balance)
-            VALUES ($1, $2, $3, $4)
+            VALUES {', '.join(values_clauses)}
             ON CONFLICT (account_id)
             DO UPDATE SET
-                available_balance = balances.available_balance + $3,
-                pending_balance = balances.pending_balance + $4,
+                available_balance = balances.available_balance + EXCLUDED.available_balance,
                 last_updated = NOW(),
                 version = balances.version + 1
             RETURNING account_id, currency, available_balance, pending_balance,
                      last_updated, version
         """
-        
-        row = await conn.fetchrow(
-            query, account_id, currency, available_delta, pending_delta
-        )
-        return Balance(**dict(row))
-    
+
+        rows = await conn.fetch(query, *flat_args)
+        return [Balance.model_validate(row, from_attributes=True) for row in rows]
+
+    async def debit_if_sufficient(self, conn, account_id: UUID, amount: Decimal,
+                                allow_overdraft: bool = False) -> Optional[Balance]:
+        """Debit an account only if it has sufficient funds.
+
+        Returns the updated balance, or None when the guard rejected the
+        debit. This is the race-free replacement for calling
+        check_sufficient_funds before an upsert.
+        """
+        stmt = conn._ledger_stmts['debit_if_sufficient']
+        row = await stmt.fetchrow(account_id, amount, allow_overdraft)
+        return Balance.model_validate(row, from_attributes=True) if row else None
+
     async def check_sufficient_funds(self, conn, account_id: UUID, amount: Decimal) -> bool:
-        """Check if account has sufficient funds"""
-        query = """
-            SELECT available_balance
-            FROM balances
-            WHERE account_id = $1
+        """Check if account has sufficient funds.
+
+        Read-only and racy by nature; the transfer path uses the guarded
+        UPDATE (debit_if_sufficient / the transfer CTE) instead.
         """
-        
-        row = await conn.fetchrow(query, account_id)
+        stmt = conn._ledger_stmts['check_sufficient_funds']
+        row = await stmt.fetchrow(account_id)
         if not row:
             return False
-        
-        return row['available_balance'] >= amount
\ No newline at end of file
+
+        return row['available_balance'] >= amount
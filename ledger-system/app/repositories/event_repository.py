@@ -4,21 +4,62 @@ from app.models.event import LedgerEvent, EventType, EventStatus
 from app.database.connection import db_manager
 from decimal import Decimal
 
+CREATE_EVENT = """
+    INSERT INTO ledger_events (
+        source_account_id, destination_account_id, amount, currency,
+        event_type, transaction_id, metadata, status
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    RETURNING id, timestamp, source_account_id, destination_account_id,
+             amount, currency, event_type, transaction_id, metadata, status, created_at
+"""
+
+# Each UNION ALL arm walks its (account_id, timestamp DESC) index already
+# ordered with the LIMIT pushed down, so the outer sort is a bounded merge
+# of two pre-sorted streams instead of a bitmap-OR plus full sort. The
+# optional event-type filter rides along in SQL rather than re-scanning
+# the materialized list in Python.
+GET_EVENTS_BY_ACCOUNT = """
+    SELECT id, timestamp, source_account_id, destination_account_id,
+           amount, currency, event_type, transaction_id, metadata, status, created_at
+    FROM (
+        (SELECT id, timestamp, source_account_id, destination_account_id,
+                amount, currency, event_type, transaction_id, metadata, status, created_at
+         FROM ledger_events
+         WHERE source_account_id = $1
+           AND ($3::varchar IS NULL OR event_type = $3)
+         ORDER BY timestamp DESC
+         LIMIT $2)
+        UNION ALL
+        (SELECT id, timestamp, source_account_id, destination_account_id,
+                amount, currency, event_type, transaction_id, metadata, status, created_at
+         FROM ledger_events
+         WHERE destination_account_id = $1
+           AND ($3::varchar IS NULL OR event_type = $3)
+         ORDER BY timestamp DESC
+         LIMIT $2)
+    ) merged
+    ORDER BY timestamp DESC
+    LIMIT $2
+"""
+
+GET_EVENTS_BY_TRANSACTION = """
+    SELECT id, timestamp, source_account_id, destination_account_id,
+           amount, currency, event_type, transaction_id, metadata, status, created_at
+    FROM ledger_events
+    WHERE transaction_id = $1
+    ORDER BY timestamp ASC
+"""
+
+db_manager.register_statement('create_event', CREATE_EVENT)
+db_manager.register_statement('get_events_by_account', GET_EVENTS_BY_ACCOUNT)
+db_manager.register_statement('get_events_by_transaction', GET_EVENTS_BY_TRANSACTION)
+
 class EventRepository:
     async def create_event(self, conn, event_data: dict) -> LedgerEvent:
         """Create a new ledger event"""
-        query = """
-            INSERT INTO ledger_events (
-                source_account_id, destination_account_id, amount, currency,
-                event_type, transaction_id, metadata, status
-            )
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            RETURNING id, timestamp, source_account_id, destination_account_id,
-                     amount, currency, event_type, transaction_id, metadata, status, created_at
-        """
-        
-        row = await conn.fetchrow(
-            query,
+        stmt = conn._ledger_stmts['create_event']
+        row = await stmt.fetchrow(
             event_data.get('source_account_id'),
             event_data.get('destination_account_id'),
             event_data['amount'],
@@ -28,34 +69,85 @@ class EventRepository:
             event_data.get('metadata', {}),
             event_data.get('status', 'SETTLED')
         )
-        
-        return LedgerEvent(**dict(row))
-    
-    async def get_events_by_account(self, account_id: UUID, limit: int = 100) -> List[LedgerEvent]:
-        """Get events for an account"""
-        query = """
-            SELECT id, timestamp, source_account_id, destination_account_id,
-                   amount, currency, event_type, transaction_id, metadata, status, created_at
-            FROM ledger_events
-            WHERE source_account_id = $1 OR destination_account_id = $1
-            ORDER BY timestamp DESC
-            LIMIT $2
+
+        return LedgerEvent.model_validate(row, from_attributes=True)
+
+    async def create_events_bulk(self, conn, events: List[dict]) -> List[LedgerEvent]:
+        """Create multiple ledger events in a single round-trip"""
+        values_clauses = []
+        flat_args = []
+        for i, event_data in enumerate(events):
+            offset = i * 8
+            values_clauses.append(
+                "(" + ", ".join(f"${offset + j}" for j in range(1, 9)) + ")"
+            )
+            flat_args.extend([
+                event_data.get('source_account_id'),
+                event_data.get('destination_account_id'),
+                event_data['amount'],
+                event_data['currency'],
+                event_data['event_type'],
+                event_data['transaction_id'],
+                event_data.get('metadata', {}),
+                event_data.get('status', 'SETTLED')
+            ])
+
+        query = f"""
+            INSERT INTO ledger_events (
+                source_account_id, destination_account_id, amount, currency,
+                event_type, transaction_id, metadata, status
+            )
+            VALUES {', '.join(values_clauses)}
+            RETURNING id, timestamp, source_account_id, destination_account_id,
+                     amount, currency, event_type, transaction_id, metadata, status, created_at
         """
-        
+
+        rows = await conn.fetch(query, *flat_args)
+        return [LedgerEvent.model_validate(row, from_attributes=True) for row in rows]
+
+    async def bulk_insert(self, conn, events: List[dict]) -> int:
+        """Bulk-load events via COPY.
+
+        Streams the whole batch over the wire in one binary COPY, which
+        is far cheaper than row-at-a-time INSERTs for large loads. No
+        RETURNING is available on this path, so use it for ingest jobs
+        that don't need the created rows back.
+        """
+        records = [
+            (
+                event_data.get('source_account_id'),
+                event_data.get('destination_account_id'),
+                event_data['amount'],
+                event_data['currency'],
+                event_data['event_type'],
+                event_data['transaction_id'],
+                event_data.get('metadata', {}),
+                event_data.get('status', 'SETTLED')
+            )
+            for event_data in events
+        ]
+
+        await conn.copy_records_to_table(
+            'ledger_events',
+            records=records,
+            columns=[
+                'source_account_id', 'destination_account_id', 'amount',
+                'currency', 'event_type', 'transaction_id', 'metadata', 'status'
+            ]
+        )
+        return len(records)
+
+    async def get_events_by_account(self, account_id: UUID, limit: int = 100,
+                                  event_type: Optional[str] = None) -> List[LedgerEvent]:
+        """Get events for an account, optionally filtered by event type"""
         async with db_manager.get_connection() as conn:
-            rows = await conn.fetch(query, account_id, limit)
-            return [LedgerEvent(**dict(row)) for row in rows]
-    
+            stmt = conn._ledger_stmts['get_events_by_account']
+            rows = await stmt.fetch(account_id, limit, event_type)
+            return [LedgerEvent.model_validate(row, from_attributes=True) for row in rows]
+
     async def get_events_by_transaction(self, transaction_id: UUID) -> List[LedgerEvent]:
         """Get all events for a transaction"""
-        query = """
-            SELECT id, timestamp, source_account_id, destination_account_id,
-                   amount, currency, event_type, transaction_id, metadata, status, created_at
-            FROM ledger_events
-            WHERE transaction_id = $1
-            ORDER BY timestamp ASC
-        """
-        
         async with db_manager.get_connection() as conn:
-            rows = await conn.fetch(query, transaction_id)
-            return [LedgerEvent(**dict(row)) for row in rows]
\ No newline at end of file
+            stmt = conn._ledger_stmts['get_events_by_transaction']
+            rows = await stmt.fetch(transaction_id)
+            return [LedgerEvent.model_validate(row, from_attributes=True) for row in rows]
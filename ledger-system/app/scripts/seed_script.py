@@ -1,4 +1,5 @@
 import asyncio
+import uvloop
 from decimal import Decimal
 from app.services.ledger_service import LedgerService
 from app.models.account import AccountCreate
@@ -11,25 +12,28 @@ async def seed_data():
     
     ledger_service = LedgerService()
     
-    # Create accounts
+    # Create accounts concurrently - they are independent of each other
     print("Creating accounts...")
-    alice = await ledger_service.create_account(
-        AccountCreate(currency="USD", type="user", metadata={"name": "Alice"})
-    )
-    bob = await ledger_service.create_account(
-        AccountCreate(currency="USD", type="user", metadata={"name": "Bob"})
-    )
-    internal_float = await ledger_service.create_account(
-        AccountCreate(currency="USD", type="internal", metadata={"name": "Internal Float"})
+    alice, bob, internal_float = await asyncio.gather(
+        ledger_service.create_account(
+            AccountCreate(currency="USD", type="user", metadata={"name": "Alice"})
+        ),
+        ledger_service.create_account(
+            AccountCreate(currency="USD", type="user", metadata={"name": "Bob"})
+        ),
+        ledger_service.create_account(
+            AccountCreate(currency="USD", type="internal", metadata={"name": "Internal Float"})
+        )
     )
     
     print(f"Alice ID: {alice.id}")
     print(f"Bob ID: {bob.id}")
     print(f"Internal Float ID: {internal_float.id}")
     
-    # Seed transactions
+    # Seed transactions. These stay sequential: each transfer spends
+    # funds delivered by the previous one.
     print("\nExecuting seed transactions...")
-    
+
     # 1. Internal_Float tops up Alice with 500
     result1 = await ledger_service.transfer_funds(
         TransferRequest(
@@ -66,11 +70,13 @@ async def seed_data():
     )
     print(f"Bob -> Alice transfer: {result3['success']}")
     
-    # Check final balances
+    # Check final balances concurrently - independent reads
     print("\nFinal balances:")
-    alice_balance = await ledger_service.get_account_balance(alice.id)
-    bob_balance = await ledger_service.get_account_balance(bob.id)
-    float_balance = await ledger_service.get_account_balance(internal_float.id)
+    alice_balance, bob_balance, float_balance = await asyncio.gather(
+        ledger_service.get_account_balance(alice.id),
+        ledger_service.get_account_balance(bob.id),
+        ledger_service.get_account_balance(internal_float.id)
+    )
     
     print(f"Alice: ${alice_balance.available_balance}")
     print(f"Bob: ${bob_balance.available_balance}")
@@ -79,4 +85,5 @@ async def seed_data():
     await db_manager.disconnect()
 
 if __name__ == "__main__":
+    uvloop.install()
     asyncio.run(seed_data())
\ No newline at end of file
@@ -11,7 +11,7 @@ class CommandProcessor:
         self.account_repo = AccountRepository()
         self.balance_repo = BalanceRepository()
     
-    async def validate_transfer(self, transfer: TransferRequest) -> Dict[str, Any]:
+    async def validate_transfer(self, transfer: TransferRequest, conn=None) -> Dict[str, Any]:
         """Validate transfer command"""
         errors = []
         
@@ -25,24 +25,26 @@ class CommandProcessor:
         if transfer.source_account_id == transfer.destination_account_id:
             errors.append("Source and destination accounts must be different")
         
-        # Check if accounts exist
-        source_exists = await self.account_repo.exists(transfer.source_account_id)
-        if not source_exists:
+        # Check existence and currency for both accounts in one round-trip
+        currencies = await self.account_repo.get_currencies_by_ids(
+            [transfer.source_account_id, transfer.destination_account_id],
+            conn=conn
+        )
+
+        source_currency = currencies.get(transfer.source_account_id)
+        if source_currency is None:
             errors.append("Source account does not exist")
-        
-        dest_exists = await self.account_repo.exists(transfer.destination_account_id)
-        if not dest_exists:
+
+        dest_currency = currencies.get(transfer.destination_account_id)
+        if dest_currency is None:
             errors.append("Destination account does not exist")
-        
+
         # Check currency compatibility (simplified - assume same currency for now)
-        if source_exists and dest_exists:
-            source_account = await self.account_repo.get_by_id(transfer.source_account_id)
-            dest_account = await self.account_repo.get_by_id(transfer.destination_account_id)
-            
-            if source_account.currency != transfer.currency:
+        if source_currency is not None and dest_currency is not None:
+            if source_currency != transfer.currency:
                 errors.append("Transfer currency doesn't match source account currency")
-            
-            if dest_account.currency != transfer.currency:
+
+            if dest_currency != transfer.currency:
                 errors.append("Transfer currency doesn't match destination account currency")
         
         return {
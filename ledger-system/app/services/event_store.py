@@ -1,6 +1,6 @@
 from uuid import UUID, uuid4
 from decimal import Decimal
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from app.models.event import LedgerEvent, EventType, EventStatus
 from app.repositories.event_repository import EventRepository
 
@@ -13,36 +13,44 @@ class EventStore:
                                    currency: str, metadata: Dict[str, Any]) -> List[LedgerEvent]:
         """Create double-entry events for a transfer"""
         transaction_id = uuid4()
-        
-        # Create debit event (money leaving source account)
-        debit_event = await self.event_repo.create_event(conn, {
-            'source_account_id': source_account_id,
-            'destination_account_id': None,
-            'amount': amount,
-            'currency': currency,
-            'event_type': EventType.DEBIT,
-            'transaction_id': transaction_id,
-            'metadata': metadata,
-            'status': EventStatus.SETTLED
-        })
-        
-        # Create credit event (money entering destination account)
-        credit_event = await self.event_repo.create_event(conn, {
-            'source_account_id': None,
-            'destination_account_id': destination_account_id,
-            'amount': amount,
-            'currency': currency,
-            'event_type': EventType.CREDIT,
-            'transaction_id': transaction_id,
-            'metadata': metadata,
-            'status': EventStatus.SETTLED
-        })
-        
-        return [debit_event, credit_event]
+
+        # Debit (money leaving source) and credit (money entering destination)
+        # are written in a single multi-row INSERT to halve round-trips
+        return await self.event_repo.create_events_bulk(conn, [
+            {
+                'source_account_id': source_account_id,
+                'destination_account_id': None,
+                'amount': amount,
+                'currency': currency,
+                'event_type': EventType.DEBIT,
+                'transaction_id': transaction_id,
+                'metadata': metadata,
+                'status': EventStatus.SETTLED
+            },
+            {
+                'source_account_id': None,
+                'destination_account_id': destination_account_id,
+                'amount': amount,
+                'currency': currency,
+                'event_type': EventType.CREDIT,
+                'transaction_id': transaction_id,
+                'metadata': metadata,
+                'status': EventStatus.SETTLED
+            }
+        ])
     
-    async def get_account_events(self, account_id: UUID, limit: int = 100) -> List[LedgerEvent]:
-        """Get events for an account"""
-        return await self.event_repo.get_events_by_account(account_id, limit)
+    async def bulk_import_events(self, conn, events: List[Dict[str, Any]]) -> int:
+        """Bulk-load pre-built events via COPY for ingest paths.
+
+        Bypasses funds checks and balance projection -- callers must
+        reproject balances after the load.
+        """
+        return await self.event_repo.bulk_insert(conn, events)
+
+    async def get_account_events(self, account_id: UUID, limit: int = 100,
+                               event_type: Optional[str] = None) -> List[LedgerEvent]:
+        """Get events for an account, optionally filtered by event type"""
+        return await self.event_repo.get_events_by_account(account_id, limit, event_type)
     
     async def get_transaction_events(self, transaction_id: UUID) -> List[LedgerEvent]:
         """Get all events for a transaction"""
@@ -1,5 +1,7 @@
-from uuid import UUID
-from typing import List, Dict, Any
+import asyncio
+import json
+from uuid import UUID, uuid4
+from typing import List, Dict, Any, Optional
 from app.models.event import TransferRequest, LedgerEvent
 from app.models.balance import Balance
 from app.models.account import Account, AccountCreate
@@ -9,6 +11,74 @@ from app.services.command_processor import CommandProcessor
 from app.services.event_store import EventStore
 from app.services.projection_engine import ProjectionEngine
 from app.database.connection import db_manager
+from app.config import settings
+
+# Writeable CTE that executes the whole transfer in one round-trip:
+# debit the source (guarded by the sufficient-funds predicate), credit the
+# destination, and append both ledger events -- all gated on the debit
+# having matched a row. Zero rows in src_update means insufficient funds
+# and nothing is written.
+EXECUTE_TRANSFER = """
+    WITH src_update AS (
+        UPDATE balances
+        SET available_balance = available_balance - $3,
+            last_updated = NOW(),
+            version = version + 1
+        WHERE account_id = $1
+          AND (available_balance >= $3 OR $4)
+        RETURNING account_id, currency, available_balance, pending_balance,
+                  last_updated, version
+    ),
+    dst_update AS (
+        UPDATE balances
+        SET available_balance = available_balance + $3,
+            last_updated = NOW(),
+            version = version + 1
+        WHERE account_id = $2
+          AND EXISTS (SELECT 1 FROM src_update)
+        RETURNING account_id, currency, available_balance, pending_balance,
+                  last_updated, version
+    ),
+    ins_events AS (
+        INSERT INTO ledger_events (
+            source_account_id, destination_account_id, amount, currency,
+            event_type, transaction_id, metadata, status
+        )
+        SELECT v.source_account_id, v.destination_account_id, v.amount,
+               v.currency, v.event_type, v.transaction_id, v.metadata, v.status
+        FROM (VALUES
+            ($1::uuid, NULL::uuid, $3::numeric, $5::varchar, 'DEBIT', $6::uuid, $7::jsonb, 'SETTLED'),
+            (NULL, $2, $3, $5, 'CREDIT', $6, $7, 'SETTLED')
+        ) AS v(source_account_id, destination_account_id, amount, currency,
+               event_type, transaction_id, metadata, status)
+        WHERE EXISTS (SELECT 1 FROM src_update)
+        RETURNING id, timestamp, source_account_id, destination_account_id,
+                  amount, currency, event_type, transaction_id, metadata,
+                  status, created_at
+    )
+    SELECT
+        (SELECT COALESCE(json_agg(e), '[]'::json) FROM (
+            SELECT id, timestamp, source_account_id, destination_account_id,
+                   amount::text AS amount, currency, event_type,
+                   transaction_id, metadata, status, created_at
+            FROM ins_events
+        ) e) AS events,
+        (SELECT COALESCE(json_agg(b), '[]'::json) FROM (
+            SELECT account_id, currency,
+                   available_balance::text AS available_balance,
+                   pending_balance::text AS pending_balance,
+                   last_updated, version
+            FROM src_update
+            UNION ALL
+            SELECT account_id, currency,
+                   available_balance::text AS available_balance,
+                   pending_balance::text AS pending_balance,
+                   last_updated, version
+            FROM dst_update
+        ) b) AS balances
+"""
+
+db_manager.register_statement('execute_transfer', EXECUTE_TRANSFER)
 
 class LedgerService:
     def __init__(self):
@@ -17,64 +87,141 @@ class LedgerService:
         self.command_processor = CommandProcessor()
         self.event_store = EventStore()
         self.projection_engine = ProjectionEngine()
-    
+
     async def create_account(self, account_data: AccountCreate) -> Account:
         """Create a new account"""
         account = await self.account_repo.create(account_data)
-        
+
         # Initialize balance
         async with db_manager.get_transaction() as conn:
             await self.balance_repo.upsert_balance(
                 conn, account.id, account.currency
             )
-        
+
         return account
-    
+
     async def transfer_funds(self, transfer: TransferRequest) -> Dict[str, Any]:
         """Process a fund transfer"""
-        # Validate command
-        validation = await self.command_processor.validate_transfer(transfer)
-        if not validation['valid']:
-            return {
-                'success': False,
-                'errors': validation['errors']
-            }
-        
-        # Process transfer in transaction
+        transaction_id = uuid4()
+
+        # The whole request holds exactly one pool connection: validation
+        # reuses the transaction's connection instead of acquiring its own
         async with db_manager.get_transaction() as conn:
-            # Check sufficient funds
-            has_funds = await self.command_processor.validate_sufficient_funds(
-                conn, transfer.source_account_id, transfer.amount
+            validation = await self.command_processor.validate_transfer(
+                transfer, conn=conn
             )
-            if not has_funds:
+            if not validation['valid']:
                 return {
                     'success': False,
-                    'errors': ['Insufficient funds']
+                    'errors': validation['errors']
                 }
-            
-            # Create events
-            events = await self.event_store.create_transfer_events(
-                conn, transfer.source_account_id, transfer.destination_account_id,
-                transfer.amount, transfer.currency, transfer.metadata
+
+            # Funds check, event inserts, and both balance updates execute
+            # as one writeable-CTE statement: a single round-trip per transfer
+            stmt = conn._ledger_stmts['execute_transfer']
+            row = await stmt.fetchrow(
+                transfer.source_account_id,
+                transfer.destination_account_id,
+                transfer.amount,
+                settings.allow_overdraft,
+                transfer.currency,
+                transaction_id,
+                transfer.metadata
             )
-            
-            # Project to balances
-            balances = await self.projection_engine.project_events_to_balances(conn, events)
-            
+
+            events = [LedgerEvent(**e) for e in json.loads(row['events'])]
+            if not events:
+                # Debit matched no row: missing balance or insufficient funds
+                return {
+                    'success': False,
+                    'errors': ['Insufficient funds']
+                }
+
+            balances = [Balance(**b) for b in json.loads(row['balances'])]
+
             return {
                 'success': True,
-                'transaction_id': events[0].transaction_id,
+                'transaction_id': transaction_id,
                 'events': events,
                 'updated_balances': balances
             }
-    
+
+    async def transfer_funds_many(self, transfers: List[TransferRequest]) -> List[Dict[str, Any]]:
+        """Process several transfers atomically on one connection.
+
+        All transfers share a single transaction and connection, so the
+        batch pays one acquire/commit instead of one per transfer. They
+        execute in order -- later transfers may spend funds credited by
+        earlier ones -- and any failure raises ValueError, rolling the
+        whole batch back.
+        """
+        results = []
+        async with db_manager.get_transaction() as conn:
+            stmt = conn._ledger_stmts['execute_transfer']
+            for transfer in transfers:
+                validation = await self.command_processor.validate_transfer(
+                    transfer, conn=conn
+                )
+                if not validation['valid']:
+                    raise ValueError('; '.join(validation['errors']))
+
+                transaction_id = uuid4()
+                row = await stmt.fetchrow(
+                    transfer.source_account_id,
+                    transfer.destination_account_id,
+                    transfer.amount,
+                    settings.allow_overdraft,
+                    transfer.currency,
+                    transaction_id,
+                    transfer.metadata
+                )
+
+                events = [LedgerEvent(**e) for e in json.loads(row['events'])]
+                if not events:
+                    raise ValueError('Insufficient funds')
+
+                results.append({
+                    'success': True,
+                    'transaction_id': transaction_id,
+                    'events': events,
+                    'updated_balances': [
+                        Balance(**b) for b in json.loads(row['balances'])
+                    ]
+                })
+
+        return results
+
     async def get_account_balance(self, account_id: UUID) -> Balance:
         """Get current account balance"""
         balance = await self.balance_repo.get_balance(account_id)
         if not balance:
             raise ValueError("Account not found or balance not initialized")
         return balance
-    
-    async def get_account_events(self, account_id: UUID, limit: int = 100) -> List[LedgerEvent]:
-        """Get events for an account"""
-        return await self.event_store.get_account_events(account_id, limit)
\ No newline at end of file
+
+    async def get_account_balances(self, account_ids: List[UUID]) -> Dict[UUID, Balance]:
+        """Get current balances for several accounts in one query"""
+        return await self.balance_repo.get_balances(account_ids)
+
+    async def get_account_events(self, account_id: UUID, limit: int = 100,
+                               event_type: Optional[str] = None) -> List[LedgerEvent]:
+        """Get events for an account, optionally filtered by event type"""
+        return await self.event_store.get_account_events(account_id, limit, event_type)
+
+    async def get_account_snapshot(self, account_id: UUID, limit: int = 100) -> Dict[str, Any]:
+        """Get recent events and current balance in one call.
+
+        asyncpg serializes queries per connection, so the two reads run
+        concurrently on separate pool connections rather than back to
+        back on one.
+        """
+        events, balance = await asyncio.gather(
+            self.event_store.get_account_events(account_id, limit),
+            self.balance_repo.get_balance(account_id)
+        )
+        if not balance:
+            raise ValueError("Account not found or balance not initialized")
+
+        return {
+            'balance': balance,
+            'events': events
+        }
@@ -5,44 +5,64 @@ from app.models.event import LedgerEvent, EventType
 from app.models.balance import Balance
 from app.repositories.balance_repository import BalanceRepository
 
+# Scale factor between Decimal amounts and integer minor units; matches
+# the NUMERIC(18,6) precision of the amount columns
+MINOR_UNIT_SCALE = 10 ** 6
+
 class ProjectionEngine:
     def __init__(self):
         self.balance_repo = BalanceRepository()
-    
+
     async def project_events_to_balances(self, conn, events: List[LedgerEvent]):
         """Project events to balance updates"""
-        balance_updates = {}
-        
+        # Fast path for the canonical transfer shape (one debit, one
+        # credit, two accounts): both deltas go down in a single
+        # multi-row upsert, skipping the aggregation dict entirely
+        if len(events) == 2:
+            debit, credit = events[0], events[1]
+            if debit.event_type != EventType.DEBIT:
+                debit, credit = credit, debit
+
+            if (debit.event_type == EventType.DEBIT and debit.source_account_id
+                    and credit.event_type == EventType.CREDIT
+                    and credit.destination_account_id
+                    and debit.source_account_id != credit.destination_account_id
+                    and debit.currency == credit.currency):
+                return await self.balance_repo.upsert_two(
+                    conn,
+                    debit.source_account_id, -debit.amount,
+                    credit.destination_account_id, credit.amount,
+                    debit.currency
+                )
+
+        # General path: aggregate deltas per account in integer minor
+        # units (native int adds instead of Decimal arithmetic), then
+        # convert back to Decimal once per account at the DB boundary
+        currencies = {}
+        deltas = {}
+
         for event in events:
+            amount_minor = int(event.amount * MINOR_UNIT_SCALE)
+
             if event.event_type == EventType.DEBIT and event.source_account_id:
                 # Debit decreases source account balance
                 account_id = event.source_account_id
-                if account_id not in balance_updates:
-                    balance_updates[account_id] = {
-                        'currency': event.currency,
-                        'available_delta': Decimal('0'),
-                        'pending_delta': Decimal('0')
-                    }
-                balance_updates[account_id]['available_delta'] -= event.amount
-            
+                currencies[account_id] = event.currency
+                deltas[account_id] = deltas.get(account_id, 0) - amount_minor
+
             elif event.event_type == EventType.CREDIT and event.destination_account_id:
                 # Credit increases destination account balance
                 account_id = event.destination_account_id
-                if account_id not in balance_updates:
-                    balance_updates[account_id] = {
-                        'currency': event.currency,
-                        'available_delta': Decimal('0'),
-                        'pending_delta': Decimal('0')
-                    }
-                balance_updates[account_id]['available_delta'] += event.amount
-        
-        # Apply balance updates
-        updated_balances = []
-        for account_id, update in balance_updates.items():
-            balance = await self.balance_repo.upsert_balance(
-                conn, account_id, update['currency'],
-                update['available_delta'], update['pending_delta']
-            )
-            updated_balances.append(balance)
-        
-        return updated_balances
\ No newline at end of file
+                currencies[account_id] = event.currency
+                deltas[account_id] = deltas.get(account_id, 0) + amount_minor
+
+        if not deltas:
+            return []
+
+        # Apply all balance updates in one multi-row upsert instead of
+        # one awaited round-trip per account
+        return await self.balance_repo.upsert_many(conn, [
+            (account_id, currencies[account_id],
+             Decimal(delta_minor) / MINOR_UNIT_SCALE)
+            for account_id, delta_minor in deltas.items()
+        ])
@@ -2,39 +2,93 @@ import pytest
 import asyncio
 from uuid import uuid4
 from decimal import Decimal
+from httpx import ASGITransport, AsyncClient
+from app.main import app
 from app.models.account import AccountCreate
 from app.services.ledger_service import LedgerService
 from app.database.connection import db_manager
 
 @pytest.fixture(scope="session")
-def event_loop():
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Run the suite on uvloop when available, matching production"""
+    try:
+        import uvloop
+        return uvloop.EventLoopPolicy()
+    except ImportError:
+        import asyncio
+        return asyncio.DefaultEventLoopPolicy()
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope="session", autouse=True)
 async def setup_database():
+    """Connect and pre-warm the pool for the whole session.
+
+    autouse so the warm-up and disconnect actually run; no test requests
+    this fixture by name.
+    """
     await db_manager.connect()
+    # Force the pool to max size up front so no test pays
+    # connection-establishment latency mid-run
+    conns = await asyncio.gather(*[
+        db_manager.pool.acquire()
+        for _ in range(db_manager.pool.get_max_size())
+    ])
+    for conn in conns:
+        await db_manager.pool.release(conn)
     yield
     await db_manager.disconnect()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+async def api_client():
+    """One AsyncClient for the whole session.
+
+    Building the client per test rebuilds the ASGI transport each time;
+    sharing one instance reuses the transport across every API test.
+    """
+    # Explicit ASGI transport: requests stay in-process (no TCP layer)
+    # and avoid httpx's deprecated app= shortcut
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+@pytest.fixture(scope="session")
 async def ledger_service():
     return LedgerService()
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+async def reset_ledger_state():
+    """Reset mutable ledger state after every test.
+
+    Accounts are module-scoped (see test_accounts), so only the event
+    log and balances are wiped; the balance rows themselves stay so
+    get_account_balance keeps working against the shared accounts.
+    """
+    yield
+    async with db_manager.get_connection() as conn:
+        await conn.execute(
+            "TRUNCATE ledger_events;"
+            " UPDATE balances SET available_balance = 0, pending_balance = 0,"
+            " version = 1, last_updated = NOW()"
+        )
+
+@pytest.fixture(scope="module")
 async def test_accounts(ledger_service):
-    """Create test accounts"""
-    alice = await ledger_service.create_account(
-        AccountCreate(currency="USD", type="user", metadata={"name": "Alice"})
-    )
-    bob = await ledger_service.create_account(
-        AccountCreate(currency="USD", type="user", metadata={"name": "Bob"})
+    """Create test accounts once per module; per-test writes are undone
+    by reset_ledger_state instead of re-inserting the accounts"""
+    # Independent inserts on separate pool connections: run them
+    # concurrently instead of paying three round-trips back to back
+    alice, bob, internal_float = await asyncio.gather(
+        ledger_service.create_account(
+            AccountCreate(currency="USD", type="user", metadata={"name": "Alice"})
+        ),
+        ledger_service.create_account(
+            AccountCreate(currency="USD", type="user", metadata={"name": "Bob"})
+        ),
+        ledger_service.create_account(
+            AccountCreate(currency="USD", type="internal", metadata={"name": "Internal Float"})
+        )
     )
-    internal_float = await ledger_service.create_account(
-        AccountCreate(currency="USD", type="internal", metadata={"name": "Internal Float"})
-    )
-    
+
+
     return {
         "alice": alice,
         "bob": bob,
@@ -1,75 +1,90 @@
+import orjson
 import pytest
-from httpx import AsyncClient
-from decimal import Decimal
-from app.main import app
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+@pytest.fixture(scope="module")
+def transfer_payloads(test_accounts):
+    """Pre-serialized request bodies for the module's shared accounts.
+
+    Built once per module so each request sends ready-made bytes via
+    content= instead of re-stringifying UUIDs and re-encoding JSON on
+    every post.
+    """
+    alice = str(test_accounts["alice"].id)
+    bob = str(test_accounts["bob"].id)
+    internal_float = str(test_accounts["internal_float"].id)
+
+    return {
+        "fund_alice": orjson.dumps({
+            "source_account_id": internal_float,
+            "destination_account_id": alice,
+            "amount": "1000.00",
+            "currency": "USD",
+            "metadata": {"description": "Initial funding"}
+        }),
+        "alice_to_bob": orjson.dumps({
+            "source_account_id": alice,
+            "destination_account_id": bob,
+            "amount": "150.00",
+            "currency": "USD",
+            "metadata": {"description": "Payment"}
+        }),
+        "negative_amount": orjson.dumps({
+            "source_account_id": alice,
+            "destination_account_id": alice,
+            "amount": "-100.00",
+            "currency": "USD"
+        }),
+        "same_account": orjson.dumps({
+            "source_account_id": alice,
+            "destination_account_id": alice,
+            "amount": "100.00",
+            "currency": "USD"
+        })
+    }
 
 @pytest.mark.asyncio
 class TestTransferAPI:
-    
-    async def test_transfer_endpoint(self, test_accounts):
+
+    async def test_transfer_endpoint(self, api_client, transfer_payloads):
         """Test transfer API endpoint"""
-        alice = test_accounts["alice"]
-        bob = test_accounts["bob"]
-        internal_float = test_accounts["internal_float"]
-        
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            # Fund Alice first
-            fund_response = await client.post(
-                "/ledger/transfer/",
-                json={
-                    "source_account_id": str(internal_float.id),
-                    "destination_account_id": str(alice.id),
-                    "amount": "1000.00",
-                    "currency": "USD",
-                    "metadata": {"description": "Initial funding"}
-                }
-            )
-            assert fund_response.status_code == 200
-            
-            # Transfer from Alice to Bob
-            transfer_response = await client.post(
-                "/ledger/transfer/",
-                json={
-                    "source_account_id": str(alice.id),
-                    "destination_account_id": str(bob.id),
-                    "amount": "150.00",
-                    "currency": "USD",
-                    "metadata": {"description": "Payment"}
-                }
-            )
-            
-            assert transfer_response.status_code == 200
-            
-            response_data = transfer_response.json()
-            assert response_data["message"] == "Transfer successful"
-            assert "transaction_id" in response_data
-            assert response_data["events_created"] == 2
-    
-    async def test_transfer_validation_errors(self, test_accounts):
+        # Fund Alice first
+        fund_response = await api_client.post(
+            "/ledger/transfer/",
+            content=transfer_payloads["fund_alice"],
+            headers=_JSON_HEADERS
+        )
+        assert fund_response.status_code == 200
+
+        # Transfer from Alice to Bob
+        transfer_response = await api_client.post(
+            "/ledger/transfer/",
+            content=transfer_payloads["alice_to_bob"],
+            headers=_JSON_HEADERS
+        )
+
+        assert transfer_response.status_code == 200
+
+        response_data = transfer_response.json()
+        assert response_data["message"] == "Transfer successful"
+        assert "transaction_id" in response_data
+        assert response_data["events_created"] == 2
+
+    async def test_transfer_validation_errors(self, api_client, transfer_payloads):
         """Test transfer validation errors"""
-        alice = test_accounts["alice"]
-        
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            # Invalid amount
-            response = await client.post(
-                "/ledger/transfer/",
-                json={
-                    "source_account_id": str(alice.id),
-                    "destination_account_id": str(alice.id),
-                    "amount": "-100.00",
-                    "currency": "USD"
-                }
-            )
-            assert response.status_code == 422  # Validation error
-            
-            # Same account transfer
-            response = await client.post(
-                "/ledger/transfer/",
-                json={
-                    "source_account_id": str(alice.id),
-                    "destination_account_id": str(alice.id),
-                    "amount": "100.00",
-                    "currency": "USD"
-                }
-            )
-            assert response.status_code == 400
\ No newline at end of file
+        # Invalid amount
+        response = await api_client.post(
+            "/ledger/transfer/",
+            content=transfer_payloads["negative_amount"],
+            headers=_JSON_HEADERS
+        )
+        assert response.status_code == 422  # Validation error
+
+        # Same account transfer
+        response = await api_client.post(
+            "/ledger/transfer/",
+            content=transfer_payloads["same_account"],
+            headers=_JSON_HEADERS
+        )
+        assert response.status_code == 400
@@ -63,12 +63,11 @@ class TestLedgerService:
         assert result["success"] is True
         assert "transaction_id" in result
         
-        # Check final balances
-        alice_balance = await ledger_service.get_account_balance(alice.id)
-        bob_balance = await ledger_service.get_account_balance(bob.id)
-        
-        assert alice_balance.available_balance == Decimal('900')
-        assert bob_balance.available_balance == Decimal('100')
+        # Check final balances with one batched read
+        balances = await ledger_service.get_account_balances([alice.id, bob.id])
+
+        assert balances[alice.id].available_balance == Decimal('900')
+        assert balances[bob.id].available_balance == Decimal('100')
     
     async def test_insufficient_funds(self, ledger_service, test_accounts):
         """Test transfer with insufficient funds"""
@@ -132,19 +131,19 @@ class TestLedgerService:
             )
         ]
         
-        for transfer in transactions:
-            await ledger_service.transfer_funds(transfer)
-        
+        await ledger_service.transfer_funds_many(transactions)
+
+
         # Get Alice's events
         alice_events = await ledger_service.get_account_events(alice.id)
-        
+
         # Alice should have 3 events: 1 credit (funding) + 2 debits (payments)
         assert len(alice_events) == 3
-        
-        # Check event types
-        credit_events = [e for e in alice_events if e.event_type == "CREDIT"]
-        debit_events = [e for e in alice_events if e.event_type == "DEBIT"]
-        
+
+        # Check event types with the filter pushed into SQL
+        credit_events = await ledger_service.get_account_events(alice.id, event_type="CREDIT")
+        debit_events = await ledger_service.get_account_events(alice.id, event_type="DEBIT")
+
         assert len(credit_events) == 1
         assert len(debit_events) == 2
         
@@ -15,3 +15,29 @@ Modules Included:
 
 __version__ = "0.1.0"
 __author__ = "Vishal (Kairon Core Infra)"
+
+from typing import Optional
+
+import httpx
+
+# One pooled HTTP client for the whole process. Opening a client per
+# fetch pays a fresh TCP+TLS handshake on every poll; the shared pool
+# keeps connections alive across reconciliation runs.
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled httpx client, creating it lazily"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=1000),
+            timeout=httpx.Timeout(30.0)
+        )
+    return _http_client
+
+async def aclose_http_client() -> None:
+    """Close the shared client on shutdown (lifespan/CLI teardown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -0,0 +1,36 @@
+from contextlib import asynccontextmanager
+import logging
+
+from fastapi import FastAPI
+
+from .. import aclose_http_client
+from ..recon.recon_engine import ReconEngine
+from ..recon.recon_logger import ReconLogger
+from .routes import router
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup: one engine/logger per worker, built when the app starts
+    # rather than at module import
+    logger.info("Starting up reconciliation API")
+    app.state.recon_engine = ReconEngine()
+    app.state.recon_logger = ReconLogger()
+    yield
+    # Shutdown
+    logger.info("Shutting down reconciliation API")
+    await aclose_http_client()
+
+app = FastAPI(
+    title="Reconciliation Engine",
+    description="Job control and result viewing for ledger reconciliation",
+    version="0.1.0",
+    lifespan=lifespan
+)
+
+app.include_router(router)
+
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy", "service": "recon-engine"}
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
-from pydantic import BaseModel
-from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict
+import orjson
+from datetime import date, datetime
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 import logging
@@ -21,12 +23,19 @@ class RunReconRequest(BaseModel):
     base_url: Optional[str] = None
     auth_token: Optional[str] = None
 
+# Response rows come from trusted DB queries, so the models are frozen
+# (no __setattr__ validation), ignore extras, and validate straight from
+# row mappings in one model_validate call per row
 class RunReconResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     job_id: UUID
     status: str
     message: str
 
 class JobStatusResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore', from_attributes=True)
+
     id: UUID
     job_date: date
     source_name: str
@@ -36,28 +45,13 @@ class JobStatusResponse(BaseModel):
     matched_count: int
     unmatched_count: int
     error_message: Optional[str]
-    started_at: Optional[str]
-    completed_at: Optional[str]
-    created_at: str
-
-class ReconLogResponse(BaseModel):
-    id: UUID
-    recon_date: date
-    source_name: str
-    external_txn_id: Optional[str]
-    ledger_txn_id: Optional[UUID]
-    matched: bool
-    mismatch_reason: Optional[str]
-    match_score: float
-    amount_difference: float
-    ledger_amount: Optional[float]
-    external_amount: Optional[float]
-    currency: Optional[str]
-    timestamp_diff_seconds: Optional[int]
-    metadata: Dict[str, Any]
-    created_at: str
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    created_at: datetime
 
 class ReconSummaryResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore', from_attributes=True)
+
     total_logs: int
     matched_count: int
     unmatched_count: int
@@ -67,42 +61,66 @@ class ReconSummaryResponse(BaseModel):
     unique_external_txns: int
     unique_ledger_txns: int
 
-# Initialize engine and logger
-recon_engine = ReconEngine()
-recon_logger = ReconLogger()
+# Engine and logger live on app.state (see api/main.py lifespan) so
+# construction happens at startup, once per worker, and tests can
+# override these dependencies
+def get_engine(request: Request) -> ReconEngine:
+    return request.app.state.recon_engine
+
+def get_logger(request: Request) -> ReconLogger:
+    return request.app.state.recon_logger
+
+# Memoized /recon/sources payload; the source registry is static
+_sources_cache: Optional[List[str]] = None
 
-@router.post("/run", response_model=RunReconResponse)
-async def run_reconciliation(request: RunReconRequest, background_tasks: BackgroundTasks):
+# Optional source-reader settings forwarded from request to engine
+_SRC_KEYS = ("file_path", "base_url", "auth_token")
+
+def _source_kwargs(request: RunReconRequest) -> Dict[str, Any]:
+    """Collect the set source-reader options in one pass"""
+    return {k: v for k in _SRC_KEYS if (v := getattr(request, k)) is not None}
+
+@router.post("/run", response_model=RunReconResponse, status_code=202)
+async def run_reconciliation(
+    request: RunReconRequest,
+    background_tasks: BackgroundTasks,
+    recon_engine: ReconEngine = Depends(get_engine),
+    recon_logger: ReconLogger = Depends(get_logger)
+):
     """
-    Start a reconciliation job for the specified date and source
+    Queue a reconciliation job for the specified date and source.
+
+    Returns immediately with the job id; poll /recon/status/{date} for
+    completion instead of holding the HTTP worker for the whole run.
     """
     try:
         # Validate source configuration
-        kwargs = {}
-        if request.file_path:
-            kwargs['file_path'] = request.file_path
-        if request.base_url:
-            kwargs['base_url'] = request.base_url
-        if request.auth_token:
-            kwargs['auth_token'] = request.auth_token
-        
-        # Validate source config
-        is_valid = await recon_engine.validate_source_config(request.source, **kwargs)
+        kwargs = _source_kwargs(request)
+        is_valid = recon_engine.validate_source_config(request.source, **kwargs)
         if not is_valid:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid configuration for source '{request.source}'"
             )
-        
-        # Start reconciliation job in background
-        job_id = await recon_engine.run(request.date, request.source, **kwargs)
-        
+
+        # Record the job as PENDING so status polling works right away;
+        # the engine upserts the same (date, source) row to RUNNING when
+        # the background task actually starts
+        job_id = await recon_logger.create_job(
+            request.date, request.source, status=ReconStatus.PENDING.value
+        )
+        background_tasks.add_task(
+            recon_engine.run, request.date, request.source, **kwargs
+        )
+
         return RunReconResponse(
             job_id=job_id,
-            status=ReconStatus.COMPLETED.value,
-            message=f"Reconciliation job completed successfully"
+            status=ReconStatus.PENDING.value,
+            message="Reconciliation job queued"
         )
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to start reconciliation job: {str(e)}")
         raise HTTPException(
@@ -111,31 +129,21 @@ async def run_reconciliation(request: RunReconRequest, background_tasks: Backgro
         )
 
 @router.get("/status/{target_date}", response_model=List[JobStatusResponse])
-async def get_job_status(target_date: date, source: Optional[str] = None):
+async def get_job_status(
+    target_date: date,
+    source: Optional[str] = None,
+    recon_logger: ReconLogger = Depends(get_logger)
+):
     """
     Get reconciliation job status for a specific date
     """
     try:
         jobs = await recon_logger.get_job_status(target_date, source)
-        
-        return [
-            JobStatusResponse(
-                id=job['id'],
-                job_date=job['job_date'],
-                source_name=job['source_name'],
-                status=job['status'],
-                total_external_txns=job['total_external_txns'] or 0,
-                total_ledger_txns=job['total_ledger_txns'] or 0,
-                matched_count=job['matched_count'] or 0,
-                unmatched_count=job['unmatched_count'] or 0,
-                error_message=job['error_message'],
-                started_at=job['started_at'].isoformat() if job['started_at'] else None,
-                completed_at=job['completed_at'].isoformat() if job['completed_at'] else None,
-                created_at=job['created_at'].isoformat()
-            )
-            for job in jobs
-        ]
-        
+
+        # Counters are COALESCEd in SQL, so each row validates in one call
+        return [JobStatusResponse.model_validate(job) for job in jobs]
+
+
     except Exception as e:
         logger.error(f"Failed to get job status: {str(e)}")
         raise HTTPException(
@@ -143,56 +151,68 @@ async def get_job_status(target_date: date, source: Optional[str] = None):
             detail=f"Failed to get job status: {str(e)}"
         )
 
-@router.get("/logs", response_model=List[ReconLogResponse])
+@router.get("/logs")
 async def get_reconciliation_logs(
     date: date = Query(..., description="Date to filter logs"),
     source: Optional[str] = Query(None, description="Source name to filter"),
     matched: Optional[bool] = Query(None, description="Filter by match status"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records"),
-    offset: int = Query(0, ge=0, description="Number of records to skip")
+    offset: int = Query(0, ge=0, description="Number of records to skip"),
+    recon_logger: ReconLogger = Depends(get_logger)
 ):
     """
-    Get reconciliation logs with optional filtering
+    Get reconciliation logs with optional filtering, streamed as NDJSON
     """
-    try:
-        logs = await recon_logger.get_recon_logs(
-            job_date=date,
-            source_name=source,
-            matched=matched,
-            limit=limit,
-            offset=offset
-        )
-        
-        return [
-            ReconLogResponse(
-                id=log['id'],
-                recon_date=log['recon_date'],
-                source_name=log['source_name'],
-                external_txn_id=log['external_txn_id'],
-                ledger_txn_id=log['ledger_txn_id'],
-                matched=log['matched'],
-                mismatch_reason=log['mismatch_reason'],
-                match_score=log['match_score'],
-                amount_difference=float(log['amount_difference']),
-                ledger_amount=float(log['ledger_amount']) if log['ledger_amount'] else None,
-                external_amount=float(log['external_amount']) if log['external_amount'] else None,
-                currency=log['currency'],
-                timestamp_diff_seconds=log['timestamp_diff_seconds'],
-                metadata=log['metadata'] or {},
-                created_at=log['created_at'].isoformat()
-            )
-            for log in logs
-        ]
-        
-    except Exception as e:
-        logger.error(f"Failed to get reconciliation logs: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get reconciliation logs: {str(e)}"
-        )
+    # Stream one NDJSON line per row: only the cursor's prefetch window
+    # is resident at a time and clients can parse while the query runs.
+    # Rows come straight from the DB, so skip Pydantic validation and
+    # serialize with orjson, which handles UUID/date/datetime in C.
+    async def generate():
+        try:
+            async for log in recon_logger.iter_recon_logs(
+                job_date=date,
+                source_name=source,
+                matched=matched,
+                limit=limit,
+                offset=offset
+            ):
+                yield orjson.dumps(_log_row_to_dict(log)) + b"\n"
+        except Exception as e:
+            logger.error(f"Failed to get reconciliation logs: {str(e)}")
+            raise
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+def _log_row_to_dict(log) -> Dict[str, Any]:
+    """Shape a recon_logs row for the NDJSON stream.
+
+    The NUMERIC columns arrive as float8 already (cast in SQL); orjson
+    handles the remaining types natively.
+    """
+    return {
+        'id': log['id'],
+        'recon_date': log['recon_date'],
+        'source_name': log['source_name'],
+        'external_txn_id': log['external_txn_id'],
+        'ledger_txn_id': log['ledger_txn_id'],
+        'matched': log['matched'],
+        'mismatch_reason': log['mismatch_reason'],
+        'match_score': log['match_score'],
+        'amount_difference': log['amount_difference'],
+        'ledger_amount': log['ledger_amount'],
+        'external_amount': log['external_amount'],
+        'currency': log['currency'],
+        'timestamp_diff_seconds': log['timestamp_diff_seconds'],
+        'metadata': log['metadata'] or {},
+        'created_at': log['created_at'].isoformat()
+    }
 
 @router.get("/summary/{target_date}/{source}", response_model=ReconSummaryResponse)
-async def get_reconciliation_summary(target_date: date, source: str):
+async def get_reconciliation_summary(
+    target_date: date,
+    source: str,
+    recon_logger: ReconLogger = Depends(get_logger)
+):
     """
     Get reconciliation summary for a specific date and source
     """
@@ -208,18 +228,13 @@ async def get_reconciliation_summary(target_date: date, source: str):
         match_rate = 0.0
         if summary['total_logs'] > 0:
             match_rate = summary['matched_count'] / summary['total_logs']
-        
-        return ReconSummaryResponse(
-            total_logs=summary['total_logs'],
-            matched_count=summary['matched_count'],
-            unmatched_count=summary['unmatched_count'],
-            match_rate=match_rate,
-            avg_match_score=float(summary['avg_match_score'] or 0),
-            total_amount_variance=float(summary['total_amount_variance'] or 0),
-            unique_external_txns=summary['unique_external_txns'],
-            unique_ledger_txns=summary['unique_ledger_txns']
+
+        # Aggregates arrive COALESCEd and float8-cast from SQL
+        return ReconSummaryResponse.model_validate(
+            {**summary, 'match_rate': match_rate}
         )
-        
+
+
     except HTTPException:
         raise
     except Exception as e:
@@ -230,14 +245,24 @@ async def get_reconciliation_summary(target_date: date, source: str):
         )
 
 @router.get("/sources", response_model=List[str])
-async def get_available_sources():
+async def get_available_sources(
+    response: Response,
+    recon_engine: ReconEngine = Depends(get_engine)
+):
     """
     Get list of available reconciliation sources
     """
+    global _sources_cache
     try:
-        sources = await recon_engine.get_available_sources()
-        return sources
-        
+        # The registered sources are fixed for the process lifetime, so
+        # compute the list once and let proxies cache the GET briefly
+        if _sources_cache is None:
+            _sources_cache = recon_engine.get_available_sources()
+
+        response.headers["Cache-Control"] = "max-age=60"
+        return _sources_cache
+
+
     except Exception as e:
         logger.error(f"Failed to get available sources: {str(e)}")
         raise HTTPException(
@@ -246,7 +271,10 @@ async def get_available_sources():
         )
 
 @router.delete("/jobs/{job_id}")
-async def cancel_job(job_id: UUID):
+async def cancel_job(
+    job_id: UUID,
+    recon_logger: ReconLogger = Depends(get_logger)
+):
     """
     Cancel a running reconciliation job
     """
@@ -267,21 +295,19 @@ async def cancel_job(job_id: UUID):
         )
 
 @router.post("/validate-source")
-async def validate_source_configuration(request: RunReconRequest):
+async def validate_source_configuration(
+    request: RunReconRequest,
+    recon_engine: ReconEngine = Depends(get_engine)
+):
     """
     Validate source configuration without running reconciliation
     """
     try:
-        kwargs = {}
-        if request.file_path:
-            kwargs['file_path'] = request.file_path
-        if request.base_url:
-            kwargs['base_url'] = request.base_url
-        if request.auth_token:
-            kwargs['auth_token'] = request.auth_token
-        
-        is_valid = await recon_engine.validate_source_config(request.source, **kwargs)
-        
+        is_valid = recon_engine.validate_source_config(
+            request.source, **_source_kwargs(request)
+        )
+
+
         return {
             "valid": is_valid,
             "source": request.source,
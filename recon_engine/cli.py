@@ -7,7 +7,14 @@ Allows users to trigger reconciliation with different sources.
 import argparse
 import asyncio
 import sys
-from datetime import datetime, date
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    # Optional: falls back to the stdlib event loop
+    pass
+from datetime import date
 from typing import Optional
 
 from recon_engine.recon.recon_engine import ReconEngine
@@ -15,8 +22,10 @@ from recon_engine.recon.recon_engine import ReconEngine
 
 def parse_date(date_str: str) -> date:
     """Parse date string in YYYY-MM-DD format"""
+    # fromisoformat is a C fast path; strptime re-compiles the format
+    # string on every call just to parse the same fixed shape
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d").date()
+        return date.fromisoformat(date_str)
     except ValueError:
         raise argparse.ArgumentTypeError(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
 
@@ -32,6 +32,18 @@ CREATE TABLE IF NOT EXISTS recon_logs (
 CREATE INDEX IF NOT EXISTS idx_recon_logs_job_id ON recon_logs (job_id);
 
 
+-- Table: recon_runs (scheduler claim ledger)
+-- One row per (source, run_date); the scheduler claims a run with
+-- INSERT ... ON CONFLICT DO NOTHING so restarts and parallel scheduler
+-- instances cannot re-run a completed day.
+CREATE TABLE IF NOT EXISTS recon_runs (
+    source TEXT NOT NULL,
+    run_date DATE NOT NULL,
+    claimed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source, run_date)
+);
+
+
 -- Table: recon_summary (optional optimization table)
 CREATE TABLE IF NOT EXISTS recon_summary (
     id UUID PRIMARY KEY,
@@ -1,6 +1,14 @@
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    # Optional: falls back to the stdlib event loop
+    pass
+
 from recon_engine.recon.recon_engine import ReconEngine
-from recon_engine.config import recon_settings
-from datetime import datetime, date
+from recon_engine.config import get_settings
+from app.database.connection import db_manager
+from datetime import datetime, date, timedelta, timezone
 import asyncio
 import logging
 
@@ -8,86 +16,120 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Atomic claim on a (source, run_date) slot: the first scheduler to insert
+# wins, any other returns no row and skips. ON CONFLICT rides on the
+# recon_runs primary key, so the dedup survives restarts and works across
+# multiple scheduler processes - unlike the in-memory set it replaces.
+CLAIM_RUN = """
+    INSERT INTO recon_runs (source, run_date)
+    VALUES ($1, $2)
+    ON CONFLICT DO NOTHING
+    RETURNING run_date
+"""
+
+# Drop the claim when a run fails so a later cycle (or wake()) retries
+# the day instead of treating it as done
+RELEASE_RUN = """
+    DELETE FROM recon_runs
+    WHERE source = $1 AND run_date = $2
+"""
+
 class ReconScheduler:
     def __init__(self):
         self.recon_engine = ReconEngine()
-        self.completed_jobs = set()  # Track jobs completed today
-        self.last_date = None
-        
-    def _reset_daily_tracking(self):
-        """Reset tracking when date changes"""
-        current_date = date.today()
-        if self.last_date != current_date:
-            self.completed_jobs.clear()
-            self.last_date = current_date
-            logger.info(f"Reset daily job tracking for {current_date}")
-    
-    def _should_run_scheduler(self):
-        """Check if current hour matches configured scheduler hour"""
-        current_hour = datetime.now().hour
-        target_hour = recon_settings.scheduler_hour
-        return current_hour == target_hour
-    
-    def _get_job_key(self, source, run_date):
-        """Generate unique key for job tracking"""
-        return f"{source}_{run_date}"
-    
+        # Set to trigger a run ahead of schedule (e.g. from an admin hook)
+        self._wake_event = asyncio.Event()
+        # Bound parallel source runs to what the connection pool can
+        # absorb; excess sources wait here instead of queueing in asyncpg
+        self._sem = asyncio.Semaphore(get_settings().max_concurrent_sources)
+
+    def wake(self):
+        """Trigger a reconciliation run without waiting for the schedule"""
+        self._wake_event.set()
+
+    def _seconds_until_next_run(self):
+        """Seconds until the next scheduled run hour.
+
+        The target is computed once in UTC (no DST steps) and the wait
+        itself rides on the event loop's monotonic clock via wait_for,
+        so a wall-clock jump mid-sleep cannot cause missed or duplicate
+        runs - the recon_runs claim catches any that slip through.
+        """
+        now = datetime.now(timezone.utc)
+        next_run = now.replace(
+            hour=get_settings().scheduler_hour, minute=0, second=0, microsecond=0
+        )
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        return max(0.0, (next_run - now).total_seconds())
+
+    async def _claim_run(self, source, run_date):
+        """Claim the (source, run_date) slot; False if already claimed"""
+        async with db_manager.get_connection() as conn:
+            row = await conn.fetchrow(CLAIM_RUN, source, run_date)
+            return row is not None
+
+    async def _release_run(self, source, run_date):
+        """Release a claimed slot after a failed run"""
+        async with db_manager.get_connection() as conn:
+            await conn.execute(RELEASE_RUN, source, run_date)
+
     async def _run_recon_for_source(self, source):
         """Run reconciliation for a specific source"""
-        today = date.today()
-        job_key = self._get_job_key(source, today)
-        
-        if job_key in self.completed_jobs:
-            logger.info(f"Skipping {source} - already completed today")
-            return
-        
-        try:
-            logger.info(f"Starting reconciliation for source: {source}")
-            await self.recon_engine.run(date=today, source=source)
-            
-            # Mark as completed
-            self.completed_jobs.add(job_key)
-            logger.info(f"Successfully completed reconciliation for source: {source}")
-            
-        except Exception as e:
-            logger.error(f"Failed to run reconciliation for source {source}: {str(e)}")
+        async with self._sem:
+            today = date.today()
+
+            if not await self._claim_run(source, today):
+                logger.info(f"Skipping {source} - already completed today")
+                return
+
+            try:
+                logger.info(f"Starting reconciliation for source: {source}")
+                await self.recon_engine.run(today, source)
+
+                logger.info(f"Successfully completed reconciliation for source: {source}")
+
+            except Exception as e:
+                logger.error(f"Failed to run reconciliation for source {source}: {str(e)}")
+                await self._release_run(source, today)
     
     async def _run_all_sources(self):
         """Run reconciliation for all configured sources"""
-        if not hasattr(recon_settings, 'sources') or not recon_settings.sources:
+        settings = get_settings()
+        if not hasattr(settings, 'sources') or not settings.sources:
             logger.warning("No sources configured for reconciliation")
             return
-        
-        logger.info(f"Starting reconciliation for {len(recon_settings.sources)} sources")
-        
-        # Run all sources concurrently
-        tasks = []
-        for source in recon_settings.sources:
-            task = asyncio.create_task(self._run_recon_for_source(source))
-            tasks.append(task)
-        
-        # Wait for all tasks to complete
-        await asyncio.gather(*tasks, return_exceptions=True)
-        
+
+        logger.info(f"Starting reconciliation for {len(settings.sources)} sources")
+
+        # Run sources concurrently; the semaphore inside
+        # _run_recon_for_source bounds how many are in flight at once
+        await asyncio.gather(
+            *(self._run_recon_for_source(source) for source in settings.sources),
+            return_exceptions=True
+        )
+
         logger.info("Completed reconciliation run for all sources")
     
     async def start(self):
         """Start the infinite scheduling loop"""
-        logger.info(f"Starting reconciliation scheduler - will run at hour {recon_settings.scheduler_hour}")
+        logger.info(f"Starting reconciliation scheduler - will run at hour {get_settings().scheduler_hour}")
         
         while True:
             try:
-                # Reset daily tracking if date changed
-                self._reset_daily_tracking()
-                
-                # Check if we should run the scheduler
-                if self._should_run_scheduler():
+                # Sleep until the next scheduled hour instead of waking
+                # every minute to compare hours; a wake() call cuts the
+                # sleep short for an early run
+                delay = self._seconds_until_next_run()
+                try:
+                    await asyncio.wait_for(self._wake_event.wait(), timeout=delay)
+                    logger.info("Woken early - starting reconciliation")
+                except asyncio.TimeoutError:
                     logger.info("Scheduler time reached - starting reconciliation")
-                    await self._run_all_sources()
-                
-                # Wait for 60 seconds before next check
-                await asyncio.sleep(60)
-                
+                self._wake_event.clear()
+
+                await self._run_all_sources()
+
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {str(e)}")
                 # Continue running even if there's an error
@@ -1,121 +1,167 @@
+from collections import OrderedDict
 from datetime import date, datetime
-from typing import List
+from typing import Dict, List, Sequence
 from decimal import Decimal
 from uuid import UUID
 import asyncpg
 from app.database.connection import db_manager
 from ..recon.recon_model import LedgerTxn
 
+# Hot queries shared by every reader method; registered on the pool so
+# each connection prepares them once and later calls skip parse/plan
+_TXN_COLUMNS = """
+    id,
+    transaction_id,
+    amount,
+    currency,
+    timestamp,
+    event_type,
+    source_account_id,
+    destination_account_id,
+    metadata
+"""
+
+GET_TXNS_FOR_DATE = f"""
+    SELECT {_TXN_COLUMNS}
+    FROM ledger_events
+    WHERE DATE(timestamp) = $1
+    ORDER BY timestamp ASC
+"""
+
+GET_TXN_BY_ID = f"""
+    SELECT {_TXN_COLUMNS}
+    FROM ledger_events
+    WHERE id = $1
+"""
+
+GET_TXNS_BY_IDS = f"""
+    SELECT {_TXN_COLUMNS}
+    FROM ledger_events
+    WHERE id = ANY($1::uuid[])
+"""
+
+# Half-open timestamp range instead of DATE(timestamp) = $1 so the
+# planner can range-scan the (timestamp, currency, amount) btree
+GET_TXNS_BY_AMOUNT_RANGE = f"""
+    SELECT {_TXN_COLUMNS}
+    FROM ledger_events
+    WHERE timestamp >= $1::date
+    AND timestamp < ($1::date + 1)
+    AND currency = $2
+    AND amount BETWEEN $3 AND $4
+    ORDER BY timestamp ASC
+"""
+
+db_manager.register_statement('recon_txns_for_date', GET_TXNS_FOR_DATE)
+db_manager.register_statement('recon_txn_by_id', GET_TXN_BY_ID)
+db_manager.register_statement('recon_txns_by_ids', GET_TXNS_BY_IDS)
+db_manager.register_statement('recon_txns_by_amount_range', GET_TXNS_BY_AMOUNT_RANGE)
+
+def _row_to_txn(row) -> LedgerTxn:
+    """Build a LedgerTxn from a ledger_events row"""
+    # asyncpg already decodes numeric as Decimal; no str() round-trip
+    return LedgerTxn(
+        id=row['id'],
+        transaction_id=row['transaction_id'],
+        amount=row['amount'],
+        currency=row['currency'],
+        timestamp=row['timestamp'],
+        event_type=row['event_type'],
+        source_account_id=row['source_account_id'],
+        destination_account_id=row['destination_account_id'],
+        metadata=row['metadata'] or {}
+    )
+
+# Completed days kept in the date cache; a week covers every re-run and
+# backfill pattern we see while bounding memory to ~7 days of ledger
+_DATE_CACHE_DAYS = 7
+
 class LedgerReader:
     """Reads internal ledger events for reconciliation"""
-    
-    async def get_transactions_for_date(self, target_date: date) -> List[LedgerTxn]:
+
+    def __init__(self):
+        # Ledger events are append-only and past days never change, so
+        # day loads for completed dates are cached (LRU, bounded to
+        # _DATE_CACHE_DAYS entries); today is always re-read
+        self._date_cache: "OrderedDict[date, tuple]" = OrderedDict()
+
+    def invalidate(self, target_date: date) -> None:
+        """Drop a cached day, e.g. after a manual ledger correction"""
+        self._date_cache.pop(target_date, None)
+
+    async def get_transactions_for_date(self, target_date: date) -> Sequence[LedgerTxn]:
         """Get all ledger transactions for a specific date"""
-        query = """
-            SELECT 
-                id,
-                transaction_id,
-                amount,
-                currency,
-                timestamp,
-                event_type,
-                source_account_id,
-                destination_account_id,
-                metadata
-            FROM ledger_events
-            WHERE DATE(timestamp) = $1
-            ORDER BY timestamp ASC
-        """
-        
+        cached = self._date_cache.get(target_date)
+        if cached is not None:
+            self._date_cache.move_to_end(target_date)
+            return cached
+
         async with db_manager.get_connection() as conn:
-            rows = await conn.fetch(query, target_date)
-            
-            transactions = []
-            for row in rows:
-                transactions.append(LedgerTxn(
-                    id=row['id'],
-                    transaction_id=row['transaction_id'],
-                    amount=Decimal(str(row['amount'])),
-                    currency=row['currency'],
-                    timestamp=row['timestamp'],
-                    event_type=row['event_type'],
-                    source_account_id=row['source_account_id'],
-                    destination_account_id=row['destination_account_id'],
-                    metadata=row['metadata'] or {}
-                ))
-            
+            stmt = conn._ledger_stmts['recon_txns_for_date']
+            # Stream via a server-side cursor so peak buffering is the
+            # prefetch window, not the whole day's result set; rows
+            # materialize into txns while later pages are still in flight
+            async with conn.transaction():
+                transactions = tuple([
+                    _row_to_txn(row)
+                    async for row in stmt.cursor(target_date, prefetch=1024)
+                ])
+
+            if target_date < date.today():
+                self._date_cache[target_date] = transactions
+                while len(self._date_cache) > _DATE_CACHE_DAYS:
+                    self._date_cache.popitem(last=False)
+
             return transactions
-    
+
+    async def iter_transactions_for_date(self, target_date: date):
+        """Stream one day's transactions row by row.
+
+        For callers that can pipeline work per transaction (index
+        building, exports) without materializing the full day; bypasses
+        the date cache. Same pattern as ReconLogger.iter_recon_logs.
+        """
+        async with db_manager.get_connection() as conn:
+            stmt = conn._ledger_stmts['recon_txns_for_date']
+            # Cursors require an open transaction in asyncpg
+            async with conn.transaction():
+                async for row in stmt.cursor(target_date, prefetch=1024):
+                    yield _row_to_txn(row)
+
     async def get_transaction_by_id(self, txn_id: UUID) -> LedgerTxn:
         """Get specific transaction by ID"""
-        query = """
-            SELECT 
-                id,
-                transaction_id,
-                amount,
-                currency,
-                timestamp,
-                event_type,
-                source_account_id,
-                destination_account_id,
-                metadata
-            FROM ledger_events
-            WHERE id = $1
-        """
-        
         async with db_manager.get_connection() as conn:
-            row = await conn.fetchrow(query, txn_id)
-            
+            stmt = conn._ledger_stmts['recon_txn_by_id']
+            row = await stmt.fetchrow(txn_id)
+
             if not row:
                 raise ValueError(f"Transaction {txn_id} not found")
-            
-            return LedgerTxn(
-                id=row['id'],
-                transaction_id=row['transaction_id'],
-                amount=Decimal(str(row['amount'])),
-                currency=row['currency'],
-                timestamp=row['timestamp'],
-                event_type=row['event_type'],
-                source_account_id=row['source_account_id'],
-                destination_account_id=row['destination_account_id'],
-                metadata=row['metadata'] or {}
-            )
-    
-    async def get_transactions_by_amount_range(self, 
+
+            return _row_to_txn(row)
+
+    async def get_transactions_by_ids(self, txn_ids: List[UUID]) -> List[LedgerTxn]:
+        """Get a batch of transactions in a single round-trip.
+
+        Replaces N get_transaction_by_id calls with one ANY($1::uuid[])
+        query; missing ids are simply absent from the result.
+        """
+        if not txn_ids:
+            return []
+
+        async with db_manager.get_connection() as conn:
+            stmt = conn._ledger_stmts['recon_txns_by_ids']
+            rows = await stmt.fetch(list(txn_ids))
+
+            return [_row_to_txn(row) for row in rows]
+
+    async def get_transactions_by_amount_range(self,
                                              target_date: date,
                                              min_amount: Decimal,
                                              max_amount: Decimal,
                                              currency: str) -> List[LedgerTxn]:
         """Get transactions within amount range for fuzzy matching"""
-        query = """
-            SELECT 
-                id,
-                transaction_id,
-                amount,
-                currency,
-                timestamp,
-                event_type,
-                source_account_id,
-                destination_account_id,
-                metadata
-            FROM ledger_events
-            WHERE DATE(timestamp) = $1
-            AND currency = $2
-            AND amount BETWEEN $3 AND $4
-            ORDER BY timestamp ASC
-        """
-        
         async with db_manager.get_connection() as conn:
-            rows = await conn.fetch(query, target_date, currency, min_amount, max_amount)
-            
-            return [LedgerTxn(
-                id=row['id'],
-                transaction_id=row['transaction_id'],
-                amount=Decimal(str(row['amount'])),
-                currency=row['currency'],
-                timestamp=row['timestamp'],
-                event_type=row['event_type'],
-                source_account_id=row['source_account_id'],
-                destination_account_id=row['destination_account_id'],
-                metadata=row['metadata'] or {}
-            ) for row in rows]
\ No newline at end of file
+            stmt = conn._ledger_stmts['recon_txns_by_amount_range']
+            rows = await stmt.fetch(target_date, currency, min_amount, max_amount)
+
+            return [_row_to_txn(row) for row in rows]
@@ -6,10 +6,15 @@ class BaseMatcher(ABC):
     """Abstract base class for transaction matchers"""
     
     @abstractmethod
-    async def match(self, 
-                   external_txn: ExternalTxn, 
-                   ledger_txns: List[LedgerTxn]) -> MatchResult:
-        """Match external transaction against ledger transactions"""
+    def match(self,
+              external_txn: ExternalTxn,
+              ledger_txns: List[LedgerTxn]) -> MatchResult:
+        """Match external transaction against ledger transactions.
+
+        Implementations that do no I/O should be plain defs; only
+        matchers that dispatch heavy scoring off the event loop (see
+        FuzzyMatcher) need an async override.
+        """
         pass
     
     def _create_match_result(self, 
@@ -1,24 +1,64 @@
-from typing import List
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
 from datetime import timedelta
+from decimal import Decimal
 from ..recon.recon_model import ExternalTxn, LedgerTxn, MatchResult
 from .base_matcher import BaseMatcher
-from ..config import recon_settings
+from ..config import get_settings
+
+@dataclass
+class LedgerIndex:
+    """Hash indices over one run's ledger transactions.
+
+    Built once per reconciliation run so each external transaction is an
+    O(1) dict lookup instead of a scan over every ledger transaction.
+    """
+    by_ext_id: Dict[str, LedgerTxn] = field(default_factory=dict)
+    by_ledger_id: Dict[str, LedgerTxn] = field(default_factory=dict)
+    by_txn_id: Dict[str, LedgerTxn] = field(default_factory=dict)
+    by_amount_ccy: Dict[Tuple[Decimal, str], List[LedgerTxn]] = field(default_factory=dict)
 
 class ExactMatcher(BaseMatcher):
     """Performs exact matching between external and ledger transactions"""
-    
-    async def match(self, 
-                   external_txn: ExternalTxn, 
-                   ledger_txns: List[LedgerTxn]) -> MatchResult:
-        """Match using exact criteria"""
-        
+
+    @staticmethod
+    def build_index(ledger_txns: List[LedgerTxn]) -> LedgerIndex:
+        """Build the lookup indices in a single pass over the ledger"""
+        index = LedgerIndex()
+        for ledger_txn in ledger_txns:
+            ext_id = ledger_txn.metadata.get('external_txn_id')
+            if ext_id:
+                index.by_ext_id[ext_id] = ledger_txn
+            index.by_ledger_id[str(ledger_txn.id)] = ledger_txn
+            index.by_txn_id[str(ledger_txn.transaction_id)] = ledger_txn
+            key = (ledger_txn.amount, ledger_txn.currency)
+            index.by_amount_ccy.setdefault(key, []).append(ledger_txn)
+        # Time-sort each amount bucket so the tolerance window is a
+        # bisect slice rather than a scan; hot amounts (round figures,
+        # standard fees) can collect thousands of same-amount rows
+        for bucket in index.by_amount_ccy.values():
+            bucket.sort(key=attrgetter('timestamp'))
+        return index
+
+    def match(self,
+              external_txn: ExternalTxn,
+              index: LedgerIndex) -> MatchResult:
+        """Match using exact criteria against a prebuilt index.
+
+        Plain def: the whole body is dict probes and comparisons, so an
+        async wrapper would only add coroutine allocation and a
+        scheduling hop per external transaction.
+        """
+
         # Try exact match by transaction ID in metadata
-        exact_match = self._find_exact_id_match(external_txn, ledger_txns)
+        exact_match = self._find_exact_id_match(external_txn, index)
         if exact_match:
             return self._validate_exact_match(external_txn, exact_match)
-        
+
         # Try exact amount + currency + timestamp match
-        amount_matches = self._find_exact_amount_matches(external_txn, ledger_txns)
+        amount_matches = self._find_exact_amount_matches(external_txn, index)
         if len(amount_matches) == 1:
             return self._validate_exact_match(external_txn, amount_matches[0])
         elif len(amount_matches) > 1:
@@ -34,41 +74,40 @@ class ExactMatcher(BaseMatcher):
             reason="No exact match found"
         )
     
-    def _find_exact_id_match(self, 
-                           external_txn: ExternalTxn, 
-                           ledger_txns: List[LedgerTxn]) -> LedgerTxn:
+    def _find_exact_id_match(self,
+                           external_txn: ExternalTxn,
+                           index: LedgerIndex) -> LedgerTxn:
         """Find match by exact transaction ID"""
-        for ledger_txn in ledger_txns:
-            # Check if external txn ID is in ledger metadata
-            if 'external_txn_id' in ledger_txn.metadata:
-                if ledger_txn.metadata['external_txn_id'] == external_txn.txn_id:
-                    return ledger_txn
-            
-            # Check if ledger transaction ID is in external metadata
-            if 'ledger_txn_id' in external_txn.metadata:
-                if str(ledger_txn.id) == external_txn.metadata['ledger_txn_id']:
-                    return ledger_txn
-        
+        # External txn ID recorded in ledger metadata
+        ledger_txn = index.by_ext_id.get(external_txn.txn_id)
+        if ledger_txn:
+            return ledger_txn
+
+        # Ledger transaction ID recorded in external metadata
+        ledger_id = external_txn.metadata.get('ledger_txn_id')
+        if ledger_id:
+            return index.by_ledger_id.get(ledger_id)
+
         return None
-    
-    def _find_exact_amount_matches(self, 
-                                 external_txn: ExternalTxn, 
-                                 ledger_txns: List[LedgerTxn]) -> List[LedgerTxn]:
+
+    def _find_exact_amount_matches(self,
+                                 external_txn: ExternalTxn,
+                                 index: LedgerIndex) -> List[LedgerTxn]:
         """Find matches by exact amount, currency, and timestamp tolerance"""
-        matches = []
-        tolerance = timedelta(seconds=recon_settings.timestamp_tolerance_seconds)
-        
-        for ledger_txn in ledger_txns:
-            # Check exact amount and currency
-            if (ledger_txn.amount == external_txn.amount and 
-                ledger_txn.currency == external_txn.currency):
-                
-                # Check timestamp tolerance
-                time_diff = abs(ledger_txn.timestamp - external_txn.timestamp)
-                if time_diff <= tolerance:
-                    matches.append(ledger_txn)
-        
-        return matches
+        tolerance = timedelta(seconds=get_settings().timestamp_tolerance_seconds)
+
+        candidates = index.by_amount_ccy.get(
+            (external_txn.amount, external_txn.currency)
+        )
+        if not candidates:
+            return []
+
+        # Buckets are time-sorted at build, so the tolerance window is
+        # the slice between two bisects instead of a full bucket scan
+        ts = attrgetter('timestamp')
+        lo = bisect_left(candidates, external_txn.timestamp - tolerance, key=ts)
+        hi = bisect_right(candidates, external_txn.timestamp + tolerance, key=ts)
+        return candidates[lo:hi]
     
     def _validate_exact_match(self, 
                             external_txn: ExternalTxn, 
@@ -93,7 +132,7 @@ class ExactMatcher(BaseMatcher):
         
         # Check timestamp tolerance
         time_diff = abs(ledger_txn.timestamp - external_txn.timestamp)
-        if time_diff.total_seconds() > recon_settings.timestamp_tolerance_seconds:
+        if time_diff.total_seconds() > get_settings().timestamp_tolerance_seconds:
             return self._create_match_result(
                 external_txn,
                 ledger_txn,
@@ -1,31 +1,245 @@
+import asyncio
 from typing import List, Dict, Any
-from decimal import Decimal
-from datetime import timedelta
-import difflib
+from dataclasses import dataclass
+import numpy as np
+from rapidfuzz import fuzz, process
+
+try:
+    import numba
+    from numba import prange
+except ImportError:  # pragma: no cover - numba is optional
+    numba = None
+    prange = range
 from ..recon.recon_model import ExternalTxn, LedgerTxn, MatchResult
 from .base_matcher import BaseMatcher
-from ..config import recon_settings
+from ..config import get_settings
+
+# Candidates kept for the Python-side metadata pass after the vectorized
+# amount/timestamp scoring; metadata string similarity is too slow to run
+# against the full ledger
+_TOP_K = 8
+
+def _score_kernel(amounts, timestamps, currency_ids,
+                  ext_amount, ext_ts, ext_ccy,
+                  w_amount, w_ts, tol_amt_pct, tol_ts):
+    """Fused amount+timestamp partial-score kernel.
+
+    Mirrors _amount_scores/_timestamp_scores in one typed loop so numba
+    can compile it to machine code; other-currency rows come back as
+    -1.0 (the mask the candidate selection expects). Rows are
+    independent, so the jitted build parallelizes the loop across cores
+    via prange (plain range without numba).
+    """
+    n = amounts.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    max_diff = tol_ts * 10.0
+    for i in prange(n):
+        if currency_ids[i] != ext_ccy:
+            out[i] = -1.0
+            continue
+
+        diff = abs(amounts[i] - ext_amount)
+        if diff == 0.0:
+            amount_score = 1.0
+        else:
+            avg = (amounts[i] + ext_amount) * 0.5
+            diff_percent = diff / avg if avg != 0.0 else 1.0
+            if diff_percent <= tol_amt_pct:
+                amount_score = 1.0 - (diff_percent / tol_amt_pct) * 0.5
+            else:
+                amount_score = max(0.0, 0.5 * (1.0 - diff_percent))
+
+        time_diff = abs(float(timestamps[i] - ext_ts))
+        if time_diff <= tol_ts:
+            ts_score = 1.0 - (time_diff / tol_ts) * 0.5
+        elif time_diff > max_diff:
+            ts_score = 0.0
+        else:
+            ts_score = 0.5 * (1.0 - (time_diff - tol_ts) / (max_diff - tol_ts))
+
+        out[i] = amount_score * w_amount + ts_score * w_ts
+    return out
+
+if numba is not None:
+    _score_kernel = numba.njit(cache=True, fastmath=True, parallel=True)(_score_kernel)
+
+def _ref_values(metadata_norm: Dict[str, str]) -> tuple:
+    """Values of reference/id-like keys from a normalized metadata view"""
+    return tuple(
+        value
+        for key, value in metadata_norm.items()
+        if 'ref' in key or 'id' in key
+    )
+
+@dataclass
+class LedgerArrays:
+    """Struct-of-arrays view of one run's ledger transactions.
+
+    Amounts, timestamps and interned currency ids live in NumPy arrays so
+    per-external-txn scoring is a handful of vector operations instead of
+    a Python loop over Decimal arithmetic.
+    """
+    txns: List[LedgerTxn]
+    amounts: np.ndarray       # float64
+    timestamps: np.ndarray    # int64 epoch seconds
+    currency_ids: np.ndarray  # int32, interned via currency_map
+    currency_map: Dict[str, int]
+    descs: List[str]          # normalized descriptions, '' where absent
+    ref_values: List[tuple]   # lowercased ref/id metadata values per txn
+    id_to_idx: Dict[Any, int] # ledger txn id -> array row
 
 class FuzzyMatcher(BaseMatcher):
     """Performs fuzzy matching with configurable weights and tolerances"""
-    
-    async def match(self, 
-                   external_txn: ExternalTxn, 
-                   ledger_txns: List[LedgerTxn]) -> MatchResult:
-        """Match using fuzzy logic with scoring"""
-        
+
+    def __init__(self):
+        # Settings are frozen for the process lifetime; bind the hot
+        # weights and tolerances to plain instance floats once instead
+        # of re-dereferencing settings attributes per pair
+        settings = get_settings()
+        self._w_amount = settings.fuzzy_weights.amount
+        self._w_ts = settings.fuzzy_weights.timestamp
+        self._w_meta = settings.fuzzy_weights.metadata
+        self._tol_ts = settings.timestamp_tolerance_seconds
+        self._tol_amt_pct = settings.amount_tolerance_percent / 100
+        self._min_score = settings.min_match_score
+
+    @staticmethod
+    def prepare_ledger(ledger_txns: List[LedgerTxn]) -> LedgerArrays:
+        """Convert the ledger to columnar arrays, once per run"""
+        currency_map: Dict[str, int] = {}
+        currency_ids = np.empty(len(ledger_txns), dtype=np.int32)
+        amounts = np.empty(len(ledger_txns), dtype=np.float64)
+        timestamps = np.empty(len(ledger_txns), dtype=np.int64)
+        descs = []
+        ref_values = []
+
+        for i, txn in enumerate(ledger_txns):
+            amounts[i] = float(txn.amount)
+            timestamps[i] = txn.timestamp_epoch
+            currency_ids[i] = currency_map.setdefault(
+                txn.currency, len(currency_map)
+            )
+            descs.append(txn.description_norm)
+            # Hoist the ref/id key scans out of the match loop; per-pair
+            # reference checks become membership tests
+            ref_values.append(_ref_values(txn.metadata_norm))
+
+        return LedgerArrays(
+            txns=list(ledger_txns),
+            amounts=amounts,
+            timestamps=timestamps,
+            currency_ids=currency_ids,
+            currency_map=currency_map,
+            descs=descs,
+            ref_values=ref_values,
+            id_to_idx={txn.id: i for i, txn in enumerate(ledger_txns)},
+        )
+
+    async def match(self,
+                   external_txn: ExternalTxn,
+                   arrays: LedgerArrays,
+                   available: np.ndarray = None) -> MatchResult:
+        """Match using fuzzy logic against prepared ledger arrays.
+
+        Dispatches match_sync to a worker thread: the scoring is pure
+        CPU (NumPy/rapidfuzz release the GIL in their C cores), so
+        running it off the event loop lets concurrent log INSERTs and
+        HTTP reads proceed while candidates are scored.
+        """
+        return await asyncio.to_thread(
+            self.match_sync, external_txn, arrays, available
+        )
+
+    def match_sync(self,
+                   external_txn: ExternalTxn,
+                   arrays: LedgerArrays,
+                   available: np.ndarray = None) -> MatchResult:
+        """Synchronous fuzzy match against prepared ledger arrays.
+
+        available, when given, is a bool mask over the arrays; rows
+        already claimed by earlier matches are excluded so one ledger
+        transaction cannot fuzzy-match twice in a run.
+        """
+
         best_match = None
         best_score = 0.0
-        
-        for ledger_txn in ledger_txns:
-            score = self._calculate_match_score(external_txn, ledger_txn)
-            
-            if score > best_score:
-                best_score = score
-                best_match = ledger_txn
-        
+
+        ccy_id = arrays.currency_map.get(external_txn.currency, -1)
+        if ccy_id >= 0 and len(arrays.txns):
+            # Fused partial scores over the whole ledger (jit-compiled
+            # when numba is present); currency acts as a gate, scored as
+            # -1.0 so masked rows can never be candidates
+            if numba is not None:
+                partial = _score_kernel(
+                    arrays.amounts, arrays.timestamps, arrays.currency_ids,
+                    float(external_txn.amount),
+                    external_txn.timestamp_epoch, ccy_id,
+                    self._w_amount, self._w_ts,
+                    self._tol_amt_pct, float(self._tol_ts)
+                )
+            else:
+                # Vectorized NumPy fallback, same branch structure
+                amount_scores = self._amount_scores(
+                    arrays.amounts, float(external_txn.amount),
+                    self._tol_amt_pct
+                )
+                timestamp_scores = self._timestamp_scores(
+                    arrays.timestamps, external_txn.timestamp_epoch,
+                    self._tol_ts
+                )
+                partial = (
+                    amount_scores * self._w_amount +
+                    timestamp_scores * self._w_ts
+                )
+                partial[arrays.currency_ids != ccy_id] = -1.0
+
+            if available is not None:
+                partial[~available] = -1.0
+
+            # Metadata similarity stays in Python, so run it only on the
+            # strongest amount/timestamp candidates, best first. A
+            # candidate's ceiling is partial + full metadata weight; once
+            # that cannot beat the best (or the match threshold), no
+            # later candidate can either
+            k = min(_TOP_K, len(partial))
+            top = np.argpartition(partial, -k)[-k:]
+            top = top[np.argsort(partial[top])[::-1]]
+
+            # Score candidate descriptions in one rapidfuzz batch call
+            # instead of one ratio() per pair inside the loop
+            desc_scores: Dict[int, float] = {}
+            if external_txn.description:
+                ext_desc = external_txn.description_norm
+                choices = {int(i): arrays.descs[i] for i in top if arrays.descs[i]}
+                if ext_desc and choices:
+                    desc_scores = {
+                        key: score / 100.0
+                        for _, score, key in process.extract(
+                            ext_desc, choices, scorer=fuzz.ratio, limit=None
+                        )
+                    }
+
+            # External-side reference values are loop-invariant here
+            ext_refs = _ref_values(external_txn.metadata_norm)
+
+            for i in top:
+                upper = float(partial[i]) + self._w_meta
+                if upper <= best_score or upper < self._min_score:
+                    break
+                metadata_score = self._calculate_metadata_similarity(
+                    external_txn, arrays.txns[i],
+                    desc_similarity=desc_scores.get(int(i)),
+                    ledger_refs=arrays.ref_values[i],
+                    ext_refs=ext_refs
+                )
+                score = float(partial[i]) + metadata_score * self._w_meta
+                if score > best_score:
+                    best_score = score
+                    best_match = arrays.txns[i]
+
         # Check if best score meets minimum threshold
-        if best_score >= recon_settings.min_match_score:
+        min_match_score = self._min_score
+        if best_score >= min_match_score:
             return self._create_match_result(
                 external_txn,
                 best_match,
@@ -33,7 +247,7 @@ class FuzzyMatcher(BaseMatcher):
                 score=best_score
             )
         else:
-            reason = f"Best match score {best_score:.3f} below threshold {recon_settings.min_match_score}"
+            reason = f"Best match score {best_score:.3f} below threshold {min_match_score}"
             return self._create_match_result(
                 external_txn,
                 best_match,
@@ -45,50 +259,103 @@ class FuzzyMatcher(BaseMatcher):
     def _calculate_match_score(self, 
                              external_txn: ExternalTxn, 
                              ledger_txn: LedgerTxn) -> float:
-        """Calculate overall match score using weighted criteria"""
-        
-        # Amount similarity
+        """Calculate overall match score using weighted criteria.
+
+        Cheap gates run first: a currency mismatch or an amount/timestamp
+        score whose ceiling cannot clear min_match_score returns before
+        the expensive metadata string comparison.
+        """
+
+        # Currency is a gate - must match
+        if external_txn.currency != ledger_txn.currency:
+            return 0.0
+
+        # Amount similarity - scored in float; Decimal arithmetic is an
+        # order of magnitude slower and the score is a float anyway
         amount_score = self._calculate_amount_similarity(
-            external_txn.amount, ledger_txn.amount
+            float(external_txn.amount), float(ledger_txn.amount)
         )
-        
+
+        # Even perfect timestamp and metadata scores cannot rescue a
+        # bad amount score; rejecting here skips both computations for
+        # the common far-off-amount case
+        if (amount_score * self._w_amount + self._w_ts + self._w_meta
+                < self._min_score):
+            return 0.0
+
         # Timestamp similarity
         timestamp_score = self._calculate_timestamp_similarity(
-            external_txn.timestamp, ledger_txn.timestamp
+            external_txn.timestamp_epoch, ledger_txn.timestamp_epoch
         )
-        
+
+        # Upper bound assumes a perfect metadata score; below threshold
+        # the metadata pass cannot change the outcome
+        partial = amount_score * self._w_amount + timestamp_score * self._w_ts
+        if partial + self._w_meta < self._min_score:
+            return 0.0
+
         # Metadata similarity
         metadata_score = self._calculate_metadata_similarity(
             external_txn, ledger_txn
         )
-        
-        # Currency must match exactly
-        currency_score = 1.0 if external_txn.currency == ledger_txn.currency else 0.0
-        
-        # Weighted combination
-        weights = recon_settings.fuzzy_weights
-        overall_score = (
-            amount_score * weights['amount'] +
-            timestamp_score * weights['timestamp'] +
-            metadata_score * weights['metadata']
-        ) * currency_score  # Currency is a gate - must match
-        
-        return overall_score
-    
-    def _calculate_amount_similarity(self, 
-                                   external_amount: Decimal, 
-                                   ledger_amount: Decimal) -> float:
+
+        return partial + metadata_score * self._w_meta
+
+    @staticmethod
+    def _amount_scores(amounts: np.ndarray,
+                       external_amount: float,
+                       tolerance_percent: float) -> np.ndarray:
+        """Vectorized counterpart of _calculate_amount_similarity"""
+        diff = np.abs(amounts - external_amount)
+        avg = (amounts + external_amount) * 0.5
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diff_percent = np.where(avg != 0, diff / avg, np.inf)
+
+        # Exact match scores 1.0, linear decay within tolerance, steeper
+        # decay outside - mirrors the scalar branches
+        return np.where(
+            diff == 0,
+            1.0,
+            np.where(
+                diff_percent <= tolerance_percent,
+                1.0 - (diff_percent / tolerance_percent) * 0.5,
+                np.maximum(0.0, 0.5 * (1.0 - np.where(np.isinf(diff_percent), 1.0, diff_percent)))
+            )
+        )
+
+    @staticmethod
+    def _timestamp_scores(timestamps: np.ndarray,
+                          external_ts: int,
+                          tolerance: float) -> np.ndarray:
+        """Vectorized counterpart of _calculate_timestamp_similarity"""
+        time_diff = np.abs(timestamps - external_ts).astype(np.float64)
+        max_diff = tolerance * 10  # Consider up to 10x tolerance
+
+        return np.where(
+            time_diff <= tolerance,
+            1.0 - (time_diff / tolerance) * 0.5,
+            np.where(
+                time_diff > max_diff,
+                0.0,
+                0.5 * (1.0 - (time_diff - tolerance) / (max_diff - tolerance))
+            )
+        )
+
+    def _calculate_amount_similarity(self,
+                                   external_amount: float,
+                                   ledger_amount: float) -> float:
         """Calculate amount similarity score (0-1)"""
         if external_amount == ledger_amount:
             return 1.0
-        
+
         # Calculate percentage difference
         avg_amount = (external_amount + ledger_amount) / 2
         if avg_amount == 0:
             return 0.0
-        
+
         diff_percent = abs(external_amount - ledger_amount) / avg_amount
-        tolerance_percent = recon_settings.amount_tolerance_percent / 100
+        tolerance_percent = self._tol_amt_pct
         
         if diff_percent <= tolerance_percent:
             # Linear decay within tolerance
@@ -97,12 +364,16 @@ class FuzzyMatcher(BaseMatcher):
             # Exponential decay outside tolerance
             return max(0.0, 0.5 * (1.0 - diff_percent))
     
-    def _calculate_timestamp_similarity(self, 
-                                      external_timestamp, 
-                                      ledger_timestamp) -> float:
-        """Calculate timestamp similarity score (0-1)"""
-        time_diff = abs((external_timestamp - ledger_timestamp).total_seconds())
-        tolerance = recon_settings.timestamp_tolerance_seconds
+    def _calculate_timestamp_similarity(self,
+                                      external_epoch: int,
+                                      ledger_epoch: int) -> float:
+        """Calculate timestamp similarity score (0-1).
+
+        Operates on cached unix seconds; an integer subtraction instead
+        of datetime arithmetic allocating a timedelta per pair.
+        """
+        time_diff = abs(external_epoch - ledger_epoch)
+        tolerance = self._tol_ts
         
         if time_diff <= tolerance:
             # Linear decay within tolerance
@@ -114,34 +385,38 @@ class FuzzyMatcher(BaseMatcher):
                 return 0.0
             return 0.5 * (1.0 - (time_diff - tolerance) / (max_diff - tolerance))
     
-    def _calculate_metadata_similarity(self, 
-                                     external_txn: ExternalTxn, 
-                                     ledger_txn: LedgerTxn) -> float:
-        """Calculate metadata similarity score (0-1) using fuzzy string matching"""
+    def _calculate_metadata_similarity(self,
+                                     external_txn: ExternalTxn,
+                                     ledger_txn: LedgerTxn,
+                                     desc_similarity: float = None,
+                                     ledger_refs: tuple = None,
+                                     ext_refs: tuple = None) -> float:
+        """Calculate metadata similarity score (0-1) using fuzzy string matching.
+
+        desc_similarity, when given, is the precomputed description score
+        from the batched rapidfuzz pass; the description key is then
+        skipped below to avoid counting it twice. ledger_refs/ext_refs
+        are precomputed reference values (see _ref_values), recomputed
+        on demand when absent.
+        """
         similarity_scores = []
-        
-        # Compare descriptions if both exist
-        if external_txn.description and hasattr(ledger_txn, 'description'):
-            ledger_desc = getattr(ledger_txn, 'description', '')
-            if ledger_desc:
-                desc_similarity = difflib.SequenceMatcher(
-                    None, 
-                    external_txn.description.lower().strip(),
-                    ledger_desc.lower().strip()
-                ).ratio()
-                similarity_scores.append(desc_similarity)
-        
-        # Compare shared metadata fields
-        external_meta = external_txn.metadata or {}
-        ledger_meta = ledger_txn.metadata or {}
-        
-        # Find common keys
-        common_keys = set(external_meta.keys()) & set(ledger_meta.keys())
-        
+
+        if desc_similarity is not None:
+            similarity_scores.append(desc_similarity)
+
+        # Compare shared metadata fields on the prenormalized views
+        external_meta = external_txn.metadata_norm
+        ledger_meta = ledger_txn.metadata_norm
+
+        # Find common keys (dict views intersect without building sets)
+        common_keys = external_meta.keys() & ledger_meta.keys()
+        if desc_similarity is not None:
+            common_keys.discard('description')
+
         for key in common_keys:
-            ext_value = str(external_meta[key]).lower().strip()
-            ledger_value = str(ledger_meta[key]).lower().strip()
-            
+            ext_value = external_meta[key]
+            ledger_value = ledger_meta[key]
+
             # Skip empty values
             if not ext_value or not ledger_value:
                 continue
@@ -151,52 +426,52 @@ class FuzzyMatcher(BaseMatcher):
                 similarity_scores.append(1.0)
             else:
                 # Use fuzzy string matching for non-exact matches
-                field_similarity = difflib.SequenceMatcher(
-                    None, ext_value, ledger_value
-                ).ratio()
+                field_similarity = fuzz.ratio(ext_value, ledger_value) / 100.0
                 similarity_scores.append(field_similarity)
         
         # Special handling for transaction references
-        ref_similarity = self._compare_transaction_references(external_txn, ledger_txn)
+        ref_similarity = self._compare_transaction_references(
+            external_txn, ledger_txn, ledger_refs=ledger_refs, ext_refs=ext_refs
+        )
         if ref_similarity > 0:
             similarity_scores.append(ref_similarity)
         
-        # Calculate weighted average of all similarity scores
-        if similarity_scores:
-            # Give more weight to higher similarity scores
-            weighted_sum = sum(score * score for score in similarity_scores)
-            weight_sum = sum(similarity_scores)
-            
-            if weight_sum > 0:
-                return weighted_sum / weight_sum
-            else:
-                return 0.0
-        else:
+        # Self-weighted mean (sum(s*s)/sum(s)): each score is weighted by
+        # itself, pulling the result toward strong agreements. One fused
+        # pass instead of two generator sums over the list
+        if not similarity_scores:
             # No comparable metadata found - neutral score
             return 0.5
+
+        num = den = 0.0
+        for score in similarity_scores:
+            num += score * score
+            den += score
+        return num / den if den > 0 else 0.0
     
-    def _compare_transaction_references(self, 
-                                      external_txn: ExternalTxn, 
-                                      ledger_txn: LedgerTxn) -> float:
+    def _compare_transaction_references(self,
+                                      external_txn: ExternalTxn,
+                                      ledger_txn: LedgerTxn,
+                                      ledger_refs: tuple = None,
+                                      ext_refs: tuple = None) -> float:
         """Compare transaction references and IDs for cross-linking"""
-        
+
+        if ledger_refs is None:
+            ledger_refs = _ref_values(ledger_txn.metadata_norm)
+        if ext_refs is None:
+            ext_refs = _ref_values(external_txn.metadata_norm)
+
         # Check if external transaction ID appears in ledger metadata
-        ledger_meta = ledger_txn.metadata or {}
-        for key, value in ledger_meta.items():
-            if 'ref' in key.lower() or 'id' in key.lower():
-                if str(value).lower() == external_txn.txn_id.lower():
-                    return 1.0
-        
+        if external_txn.txn_id.lower() in ledger_refs:
+            return 1.0
+
         # Check if ledger transaction ID appears in external metadata
-        external_meta = external_txn.metadata or {}
-        for key, value in external_meta.items():
-            if 'ref' in key.lower() or 'id' in key.lower():
-                if str(value).lower() == str(ledger_txn.id).lower():
-                    return 1.0
+        if str(ledger_txn.id).lower() in ext_refs:
+            return 1.0
         
         # Check description for ID patterns
         if external_txn.description:
-            desc_lower = external_txn.description.lower()
+            desc_lower = external_txn.description_norm
             
             # Look for ledger transaction ID in description
             if str(ledger_txn.id).lower() in desc_lower:
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date, datetime
 from uuid import UUID, uuid4
 from typing import Optional
@@ -5,32 +6,148 @@ import asyncpg
 from app.database.connection import db_manager
 from .recon_model import MatchResult, ReconStatus
 
+# Cast the NUMERIC columns to float8 in SQL so asyncpg hands back native
+# floats and callers skip a per-value Decimal -> float conversion
+_LOG_COLUMNS = """
+    id, recon_date, source_name, external_txn_id, ledger_txn_id,
+    matched, mismatch_reason,
+    match_score::float8 AS match_score,
+    amount_difference::float8 AS amount_difference,
+    ledger_amount::float8 AS ledger_amount,
+    external_amount::float8 AS external_amount,
+    currency, timestamp_diff_seconds, metadata, created_at
+"""
+
+# Jobs before first finalize carry NULL counters; COALESCE them so the
+# response models validate rows without per-field fixups
+_JOB_COLUMNS = """
+    id, job_date, source_name, status,
+    COALESCE(total_external_txns, 0) AS total_external_txns,
+    COALESCE(total_ledger_txns, 0) AS total_ledger_txns,
+    COALESCE(matched_count, 0) AS matched_count,
+    COALESCE(unmatched_count, 0) AS unmatched_count,
+    error_message, started_at, completed_at, created_at
+"""
+
+# Flush the buffered match results once this many rows accumulate, or
+# after this long with rows pending, whichever comes first
+_LOG_FLUSH_SIZE = 500
+_LOG_FLUSH_INTERVAL = 0.1
+
+# Bound on rows queued for the writer; producers block here instead of
+# growing the buffer without limit when the database falls behind
+_LOG_QUEUE_SIZE = 10_000
+
+# Queued by flush() to stop the writer. Cancellation is not safe here:
+# a cancel landing inside _write_batch would leave the batch in an
+# unknown state and re-writing it could duplicate audit rows.
+_STOP = object()
+
+# Hot statements registered on the pool (same registry the ledger reader
+# uses) so every connection prepares them once; per-call parse/plan goes
+# away for the thousands of log writes a job produces
+CREATE_JOB = """
+    INSERT INTO recon_jobs (
+        id, job_date, source_name, status, started_at, created_at
+    ) VALUES ($1, $2, $3, $4, $5, $6)
+    ON CONFLICT (job_date, source_name)
+    DO UPDATE SET
+        status = EXCLUDED.status,
+        started_at = EXCLUDED.started_at,
+        updated_at = NOW()
+    RETURNING id
+"""
+
+FINALIZE_JOB = """
+    UPDATE recon_jobs
+    SET
+        status = $2,
+        total_external_txns = $3,
+        total_ledger_txns = $4,
+        matched_count = $5,
+        unmatched_count = $6,
+        error_message = $7,
+        completed_at = $8,
+        updated_at = NOW()
+    WHERE id = $1
+"""
+
+INSERT_LOG = """
+    INSERT INTO recon_logs (
+        recon_date,
+        source_name,
+        external_txn_id,
+        ledger_txn_id,
+        matched,
+        mismatch_reason,
+        match_score,
+        amount_difference,
+        ledger_amount,
+        external_amount,
+        currency,
+        timestamp_diff_seconds,
+        metadata,
+        created_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
+"""
+
+db_manager.register_statement('recon_create_job', CREATE_JOB)
+db_manager.register_statement('recon_finalize_job', FINALIZE_JOB)
+db_manager.register_statement('recon_insert_log', INSERT_LOG)
+
+def _build_log_queries():
+    """The four filter variants of the log query, built once.
+
+    Rebuilding the SQL per request both allocates strings on a hot
+    dashboard path and defeats asyncpg's statement cache, since every
+    f-string variant is distinct SQL text. Keyed by
+    (has_source, has_matched).
+    """
+    queries = {}
+    for has_source in (False, True):
+        for has_matched in (False, True):
+            conditions = ["recon_date = $1"]
+            n = 1
+            if has_source:
+                n += 1
+                conditions.append(f"source_name = ${n}")
+            if has_matched:
+                n += 1
+                conditions.append(f"matched = ${n}")
+            queries[(has_source, has_matched)] = f"""
+                SELECT {_LOG_COLUMNS} FROM recon_logs
+                WHERE {' AND '.join(conditions)}
+                ORDER BY created_at DESC
+                LIMIT ${n + 1} OFFSET ${n + 2}
+            """
+    return queries
+
+_LOG_QUERIES = _build_log_queries()
+
 class ReconLogger:
     """Handles database operations for reconciliation logging"""
-    
-    async def create_job(self, job_date: date, source_name: str) -> UUID:
+
+    def __init__(self):
+        # log_result feeds rows through a queue drained by one writer
+        # task, which batches them into executemany flushes on size or
+        # _LOG_FLUSH_INTERVAL. Success and failure rows share the same
+        # path, so error bursts cannot splinter the batching. Engines
+        # must call flush() before finalizing a job.
+        self._log_q: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+    async def create_job(self, job_date: date, source_name: str,
+                        status: str = ReconStatus.RUNNING.value) -> UUID:
         """Create a new reconciliation job entry"""
         job_id = uuid4()
-        
-        query = """
-            INSERT INTO recon_jobs (
-                id, job_date, source_name, status, started_at, created_at
-            ) VALUES ($1, $2, $3, $4, $5, $6)
-            ON CONFLICT (job_date, source_name) 
-            DO UPDATE SET 
-                status = EXCLUDED.status,
-                started_at = EXCLUDED.started_at,
-                updated_at = NOW()
-            RETURNING id
-        """
-        
+
         async with db_manager.get_connection() as conn:
-            result = await conn.fetchrow(
-                query, 
-                job_id, 
-                job_date, 
-                source_name, 
-                ReconStatus.RUNNING.value,
+            stmt = conn._ledger_stmts['recon_create_job']
+            result = await stmt.fetchrow(
+                job_id,
+                job_date,
+                source_name,
+                status,
                 datetime.now(),
                 datetime.now()
             )
@@ -46,24 +163,10 @@ class ReconLogger:
                           status: str = "COMPLETED",
                           error_message: Optional[str] = None) -> None:
         """Finalize job with completion metrics"""
-        
-        query = """
-            UPDATE recon_jobs 
-            SET 
-                status = $2,
-                total_external_txns = $3,
-                total_ledger_txns = $4,
-                matched_count = $5,
-                unmatched_count = $6,
-                error_message = $7,
-                completed_at = $8,
-                updated_at = NOW()
-            WHERE id = $1
-        """
-        
+
         async with db_manager.get_connection() as conn:
-            await conn.execute(
-                query,
+            stmt = conn._ledger_stmts['recon_finalize_job']
+            await stmt.fetch(
                 job_id,
                 status,
                 total_external_txns,
@@ -74,69 +177,115 @@ class ReconLogger:
                 datetime.now()
             )
     
-    async def log_result(self, 
-                        job_date: date, 
-                        source_name: str, 
-                        result: MatchResult) -> None:
-        """Log a single match result"""
-        
-        query = """
-            INSERT INTO recon_logs (
-                recon_date,
-                source_name,
-                external_txn_id,
-                ledger_txn_id,
-                matched,
-                mismatch_reason,
-                match_score,
-                amount_difference,
-                ledger_amount,
-                external_amount,
-                currency,
-                timestamp_diff_seconds,
-                metadata,
-                created_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
+    def _ensure_writer(self) -> None:
+        """Start the drain task lazily, on the loop that first logs"""
+        if self._log_q is None:
+            self._log_q = asyncio.Queue(maxsize=_LOG_QUEUE_SIZE)
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._drain_log_q())
+
+    async def _drain_log_q(self) -> None:
+        """Accumulate queued rows and write them on size or interval.
+
+        Exits on the _STOP sentinel, after writing whatever it has
+        accumulated; every row is written exactly once.
         """
-        
-        # Extract additional data from metadata if available
+        batch: list = []
+        while True:
+            try:
+                row = await asyncio.wait_for(
+                    self._log_q.get(), timeout=_LOG_FLUSH_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                if batch:
+                    await self._write_batch(batch)
+                    batch = []
+                continue
+            if row is _STOP:
+                if batch:
+                    await self._write_batch(batch)
+                return
+            batch.append(row)
+            if len(batch) >= _LOG_FLUSH_SIZE:
+                await self._write_batch(batch)
+                batch = []
+
+    async def log_result(self,
+                        job_date: date,
+                        source_name: str,
+                        result: MatchResult) -> None:
+        """Queue a single match result for the batching writer task"""
+
+        # Extract additional data from metadata if available. Enhancement
+        # writes external_currency/ledger_currency, never a bare
+        # 'currency' key - reading that left the column NULL on every row
         metadata = result.metadata or {}
         ledger_amount = metadata.get('ledger_amount')
         external_amount = metadata.get('external_amount')
-        currency = metadata.get('currency')
-        
+        currency = metadata.get('external_currency')
+
+        self._ensure_writer()
+        await self._log_q.put((
+            job_date,
+            source_name,
+            result.external_txn_id,
+            result.ledger_txn_id,
+            result.matched,
+            result.mismatch_reason,
+            result.match_score,
+            result.amount_diff,
+            ledger_amount,
+            external_amount,
+            currency,
+            result.timestamp_diff_seconds,
+            metadata
+        ))
+
+    async def flush(self) -> None:
+        """Stop the writer and persist every queued match result.
+
+        Shuts the writer down via the queue sentinel rather than
+        cancellation: cancelling mid-_write_batch and re-writing the
+        batch could insert the same rows twice into recon_logs, which
+        has no unique constraint to absorb the duplicate.
+        """
+        if self._writer_task is not None:
+            await self._log_q.put(_STOP)
+            await self._writer_task
+            self._writer_task = None
+
+        if self._log_q is None or self._log_q.empty():
+            return
+
+        # Rows that arrived after the writer stopped
+        batch = []
+        while not self._log_q.empty():
+            batch.append(self._log_q.get_nowait())
+        await self._write_batch(batch)
+
+    async def _write_batch(self, batch: list) -> None:
+        """Write one batch of rows in a single executemany round-trip"""
+        # One clock read stamps the whole batch; rows land together
+        # anyway, and per-row datetime.now() is a syscall each
+        created_at = datetime.now()
+
         async with db_manager.get_connection() as conn:
-            await conn.execute(
-                query,
-                job_date,
-                source_name,
-                result.external_txn_id,
-                result.ledger_txn_id,
-                result.matched,
-                result.mismatch_reason,
-                result.match_score,
-                result.amount_diff,
-                ledger_amount,
-                external_amount,
-                currency,
-                result.timestamp_diff_seconds,
-                metadata,
-                datetime.now()
-            )
-    
+            stmt = conn._ledger_stmts['recon_insert_log']
+            await stmt.executemany([(*row, created_at) for row in batch])
+
     async def get_job_status(self, job_date: date, source_name: Optional[str] = None):
         """Get job status for a specific date"""
         
         if source_name:
-            query = """
-                SELECT * FROM recon_jobs 
+            query = f"""
+                SELECT {_JOB_COLUMNS} FROM recon_jobs
                 WHERE job_date = $1 AND source_name = $2
                 ORDER BY created_at DESC
             """
             params = [job_date, source_name]
         else:
-            query = """
-                SELECT * FROM recon_jobs 
+            query = f"""
+                SELECT {_JOB_COLUMNS} FROM recon_jobs
                 WHERE job_date = $1
                 ORDER BY created_at DESC
             """
@@ -153,46 +302,55 @@ class ReconLogger:
                            limit: int = 100,
                            offset: int = 0):
         """Get reconciliation logs with filtering"""
-        
-        conditions = ["recon_date = $1"]
+
+        query = _LOG_QUERIES[(bool(source_name), matched is not None)]
         params = [job_date]
-        param_count = 1
-        
         if source_name:
-            param_count += 1
-            conditions.append(f"source_name = ${param_count}")
             params.append(source_name)
-        
         if matched is not None:
-            param_count += 1
-            conditions.append(f"matched = ${param_count}")
             params.append(matched)
-        
-        where_clause = " AND ".join(conditions)
-        
-        query = f"""
-            SELECT * FROM recon_logs 
-            WHERE {where_clause}
-            ORDER BY created_at DESC
-            LIMIT ${param_count + 1} OFFSET ${param_count + 2}
-        """
-        
         params.extend([limit, offset])
-        
+
         async with db_manager.get_connection() as conn:
             rows = await conn.fetch(query, *params)
             return [dict(row) for row in rows]
     
+    async def iter_recon_logs(self,
+                            job_date: date,
+                            source_name: Optional[str] = None,
+                            matched: Optional[bool] = None,
+                            limit: int = 100,
+                            offset: int = 0):
+        """Stream reconciliation logs row by row.
+
+        Uses a server-side cursor so only a prefetch window is held in
+        memory, letting callers start consuming before the query
+        finishes. Same filters as get_recon_logs.
+        """
+        query = _LOG_QUERIES[(bool(source_name), matched is not None)]
+        params = [job_date]
+        if source_name:
+            params.append(source_name)
+        if matched is not None:
+            params.append(matched)
+        params.extend([limit, offset])
+
+        async with db_manager.get_connection() as conn:
+            # Cursors require an open transaction in asyncpg
+            async with conn.transaction():
+                async for row in conn.cursor(query, *params, prefetch=256):
+                    yield row
+
     async def get_recon_summary(self, job_date: date, source_name: str):
         """Get reconciliation summary for a specific date and source"""
         
         query = """
-            SELECT 
+            SELECT
                 COUNT(*) as total_logs,
                 COUNT(*) FILTER (WHERE matched = true) as matched_count,
                 COUNT(*) FILTER (WHERE matched = false) as unmatched_count,
-                AVG(match_score) as avg_match_score,
-                SUM(ABS(amount_difference)) as total_amount_variance,
+                COALESCE(AVG(match_score), 0)::float8 as avg_match_score,
+                COALESCE(SUM(ABS(amount_difference)), 0)::float8 as total_amount_variance,
                 COUNT(DISTINCT external_txn_id) as unique_external_txns,
                 COUNT(DISTINCT ledger_txn_id) as unique_ledger_txns
             FROM recon_logs
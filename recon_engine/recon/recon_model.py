@@ -1,4 +1,6 @@
 from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from functools import cached_property
 from uuid import UUID
 from datetime import datetime, date
 from decimal import Decimal
@@ -20,8 +22,47 @@ class ExternalTxn(BaseModel):
     description: Optional[str] = None
     metadata: Dict[str, Any] = {}
 
-class LedgerTxn(BaseModel):
-    """Internal ledger transaction"""
+    # Normalized once per txn instead of per comparison in the matchers
+    @cached_property
+    def description_norm(self) -> str:
+        return self.description.lower().strip() if self.description else ''
+
+    @cached_property
+    def metadata_norm(self) -> Dict[str, str]:
+        return {
+            key.lower(): str(value).lower().strip()
+            for key, value in (self.metadata or {}).items()
+        }
+
+    @cached_property
+    def timestamp_epoch(self) -> int:
+        """Unix seconds, computed once; time diffs against ledger rows
+        become integer subtraction instead of timedelta arithmetic."""
+        return int(self.timestamp.timestamp())
+
+    @cached_property
+    def wire_metadata(self) -> Dict[str, Any]:
+        """External-side fields attached to every logged match result.
+
+        Cached so the float/isoformat conversions run once per txn, not
+        once per enhancement.
+        """
+        return {
+            'external_amount': float(self.amount),
+            'external_currency': self.currency,
+            'external_timestamp': self.timestamp.isoformat(),
+            'external_description': self.description
+        }
+
+@dataclass(frozen=True, slots=True)
+class LedgerTxn:
+    """Internal ledger transaction.
+
+    Materialized straight from trusted ledger_events rows, often 100k+
+    per day, so this is a slotted frozen dataclass rather than a
+    pydantic model: no per-instance __dict__ and no validation cost on
+    a path where asyncpg already hands back the right types.
+    """
     id: UUID
     transaction_id: UUID
     amount: Decimal
@@ -30,18 +71,43 @@ class LedgerTxn(BaseModel):
     event_type: str
     source_account_id: Optional[UUID] = None
     destination_account_id: Optional[UUID] = None
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    # Lowercased/stripped metadata view, computed at materialization so
+    # matcher comparisons never re-normalize the same strings
+    metadata_norm: Dict[str, str] = field(init=False, default_factory=dict)
+    description_norm: str = field(init=False, default='')
+    # ISO timestamp rendered once at materialization; enhancement would
+    # otherwise re-format it for every result that matches this row
+    timestamp_iso: str = field(init=False, default='')
+    # Unix seconds for integer time diffs in the matchers
+    timestamp_epoch: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        norm = {
+            key.lower(): str(value).lower().strip()
+            for key, value in (self.metadata or {}).items()
+        }
+        object.__setattr__(self, 'metadata_norm', norm)
+        object.__setattr__(self, 'description_norm', norm.get('description', ''))
+        object.__setattr__(self, 'timestamp_iso', self.timestamp.isoformat())
+        object.__setattr__(self, 'timestamp_epoch', int(self.timestamp.timestamp()))
+
+@dataclass(slots=True, frozen=True)
+class MatchResult:
+    """Result of matching external vs internal transaction.
 
-class MatchResult(BaseModel):
-    """Result of matching external vs internal transaction"""
+    Constructed internally per external transaction (plus once more by
+    _enhance_match_result), so like LedgerTxn it is a slotted dataclass:
+    the fields are produced by our own code and need no validation.
+    """
     matched: bool
     match_score: float
+    external_txn_id: str
     mismatch_reason: Optional[str] = None
     ledger_txn_id: Optional[UUID] = None
-    external_txn_id: str
     amount_diff: Decimal = Decimal('0')
     timestamp_diff_seconds: int = 0
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 class ReconLog(BaseModel):
     """Reconciliation log entry"""
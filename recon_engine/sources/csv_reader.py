@@ -1,11 +1,83 @@
 import csv
 import io
+import sys
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import List, Dict, Any
 from dateutil import parser
 from ..recon.recon_model import ExternalTxn
 
+# Common non-ISO bank statement formats, probed in order the first time
+# a new timestamp shape appears
+_PROBE_FORMATS = (
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y',
+    '%d-%m-%Y %H:%M:%S',
+    '%d-%m-%Y',
+    '%d/%m/%Y %H:%M:%S',
+)
+
+# Currency symbols/group separators stripped in one C-level pass
+# instead of two chained replace() copies per amount
+_AMOUNT_STRIP = str.maketrans('', '', '$,')
+
+# Currency codes draw from a tiny alphabet; interning collapses the
+# per-row .upper() allocations to one shared string per code, and
+# downstream equality checks become pointer compares
+_CCY_CACHE: Dict[str, str] = {}
+
+def _intern_ccy(code: str) -> str:
+    cached = _CCY_CACHE.get(code)
+    if cached is None:
+        cached = sys.intern(code)
+        _CCY_CACHE[code] = cached
+    return cached
+
+# Statements repeat common amounts (fees, round figures); Decimal is
+# immutable, so sharing instances is safe and trims allocations
+@lru_cache(maxsize=8192)
+def _cached_decimal(amount_str: str) -> Decimal:
+    return Decimal(amount_str)
+
+# Shape signature (digits collapsed to '9') -> strptime format that
+# parsed it. A file uses one or two formats, so after the first row
+# every later one is a dict hit + one strptime call.
+_format_cache: Dict[str, str] = {}
+
+def _fast_parse_datetime(value: str) -> datetime:
+    """Parse a CSV timestamp, trying the ISO fast path first.
+
+    Reconciliation CSVs are machine-emitted and almost always ISO-8601;
+    fromisoformat is a C parser, while dateutil probes dozens of formats
+    per call. Non-ISO bank formats are learned per shape signature so a
+    whole file parses with strptime after the first row; dateutil stays
+    as the last-resort fallback for irregular rows. Module-level so the
+    hot loop skips the bound-method lookup.
+    """
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        pass
+
+    sig = ''.join('9' if c.isdigit() else c for c in value)
+    fmt = _format_cache.get(sig)
+    if fmt is not None:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+
+    for fmt in _PROBE_FORMATS:
+        try:
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        _format_cache[sig] = fmt
+        return parsed
+
+    return parser.parse(value)
+
 class CSVReader:
     """Reads external transaction data from CSV files"""
     
@@ -13,31 +85,67 @@ class CSVReader:
         self.required_columns = required_columns or [
             'txn_id', 'amount', 'currency', 'timestamp'
         ]
+        # Frozen view for the per-column membership test in the metadata
+        # loop; the list would be scanned linearly for every cell
+        self._required_set = frozenset(self.required_columns)
+        # Per-read memo of parsed timestamps; settlement feeds cluster
+        # many rows on the same second, so most rows skip parsing
+        self._ts_cache: Dict[str, datetime] = {}
     
     def read_from_file(self, file_path: str) -> List[ExternalTxn]:
         """Read transactions from CSV file"""
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return self.read_from_content(file.read())
-    
+        return list(self.iter_from_file(file_path))
+
+    def iter_from_file(self, file_path: str):
+        """Stream transactions from a CSV file one at a time.
+
+        Rows are parsed straight off the file handle, so peak memory is
+        one row plus the csv module's read-ahead instead of the whole
+        statement buffered twice (file.read() + StringIO).
+        """
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
+            yield from self._iter_parsed(file)
+
     def read_from_content(self, csv_content: str) -> List[ExternalTxn]:
         """Read transactions from CSV content string"""
-        transactions = []
-        
-        # Parse CSV
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
-        
+        return list(self._iter_parsed(io.StringIO(csv_content)))
+
+    def _iter_parsed(self, line_source):
+        """Parse and yield transactions from an iterable of CSV lines"""
+        # csv.reader over positional lists: DictReader would build and
+        # hash-fill a fresh dict per row, so column positions are
+        # resolved once from the header instead
+        csv_reader = csv.reader(line_source)
+        headers = next(csv_reader, None) or []
+
         # Validate headers
-        self._validate_headers(csv_reader.fieldnames)
-        
-        for row_num, row in enumerate(csv_reader, start=2):
-            try:
-                txn = self._parse_row(row)
-                transactions.append(txn)
-            except Exception as e:
-                raise ValueError(f"Error parsing row {row_num}: {str(e)}")
-        
-        return transactions
+        self._validate_headers(headers)
+        idx = {name: i for i, name in enumerate(headers)}
+
+        self._ts_cache = {}
+        row_num = 1
+        try:
+            # One handler around the whole loop instead of a try/except
+            # per row; well-formed files never pay for the error path
+            for row in csv_reader:
+                row_num += 1
+                if not row:
+                    continue
+                yield self._parse_row(row, headers, idx)
+        except Exception as e:
+            raise ValueError(f"Error parsing row {row_num}: {str(e)}") from e
+        finally:
+            # Bound memory to one read's worth of distinct timestamps
+            self._ts_cache = {}
     
+    def _parse_timestamp(self, timestamp_str: str) -> datetime:
+        """Parse a timestamp, memoized for the current read"""
+        timestamp = self._ts_cache.get(timestamp_str)
+        if timestamp is None:
+            timestamp = _fast_parse_datetime(timestamp_str)
+            self._ts_cache[timestamp_str] = timestamp
+        return timestamp
+
     def _validate_headers(self, headers: List[str]):
         """Validate CSV headers contain required columns"""
         missing_columns = []
@@ -48,34 +156,44 @@ class CSVReader:
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
     
-    def _parse_row(self, row: Dict[str, str]) -> ExternalTxn:
-        """Parse a single CSV row into ExternalTxn"""
-        try:
-            # Parse timestamp
-            timestamp_str = row['timestamp'].strip()
-            timestamp = parser.parse(timestamp_str)
-            
-            # Parse amount
-            amount_str = row['amount'].strip().replace('$', '').replace(',', '')
-            amount = Decimal(amount_str)
-            
-            # Build metadata from additional columns
-            metadata = {}
-            for key, value in row.items():
-                if key not in self.required_columns and value:
-                    metadata[key] = value.strip()
-            
-            return ExternalTxn(
-                txn_id=row['txn_id'].strip(),
-                amount=amount,
-                currency=row['currency'].strip().upper(),
-                timestamp=timestamp,
-                description=row.get('description', '').strip() or None,
-                metadata=metadata
-            )
-        
-        except Exception as e:
-            raise ValueError(f"Invalid row data: {str(e)}")
+    def _parse_row(self,
+                   row: List[str],
+                   headers: List[str],
+                   idx: Dict[str, int]) -> ExternalTxn:
+        """Parse a single positional CSV row into ExternalTxn.
+
+        Raises on malformed data; _iter_parsed attaches the row number.
+        """
+        # Parse timestamp
+        timestamp_str = row[idx['timestamp']].strip()
+        timestamp = self._parse_timestamp(timestamp_str)
+
+        # Parse amount
+        amount_str = row[idx['amount']].strip().translate(_AMOUNT_STRIP)
+        amount = _cached_decimal(amount_str)
+
+        # Build metadata from additional columns
+        metadata = {
+            headers[i]: value.strip()
+            for i, value in enumerate(row)
+            if value and headers[i] not in self._required_set
+        }
+
+        description = None
+        if 'description' in idx:
+            description = row[idx['description']].strip() or None
+
+        # Every field is already parsed to its target type above, so
+        # skip pydantic validation; model_validate remains available
+        # to callers that ingest untrusted rows
+        return ExternalTxn.model_construct(
+            txn_id=row[idx['txn_id']].strip(),
+            amount=amount,
+            currency=_intern_ccy(row[idx['currency']].strip().upper()),
+            timestamp=timestamp,
+            description=description,
+            metadata=metadata
+        )
 
 class BankCSVReader(CSVReader):
     """Specialized CSV reader for bank statement formats"""
@@ -85,28 +203,30 @@ class BankCSVReader(CSVReader):
             'transaction_id', 'amount', 'currency', 'date', 'description'
         ])
     
-    def _parse_row(self, row: Dict[str, str]) -> ExternalTxn:
-        """Parse bank-specific CSV format"""
-        try:
-            # Handle different date formats
-            date_str = row['date'].strip()
-            timestamp = parser.parse(date_str)
-            
-            # Handle negative amounts (debits)
-            amount_str = row['amount'].strip().replace('$', '').replace(',', '')
-            amount = abs(Decimal(amount_str))  # Take absolute value
-            
-            return ExternalTxn(
-                txn_id=row['transaction_id'].strip(),
-                amount=amount,
-                currency=row['currency'].strip().upper(),
-                timestamp=timestamp,
-                description=row.get('description', '').strip() or None,
-                metadata={
-                    'source_format': 'bank_csv',
-                    'original_amount': amount_str
-                }
-            )
-        
-        except Exception as e:
-            raise ValueError(f"Invalid bank CSV row: {str(e)}")
+    def _parse_row(self,
+                   row: List[str],
+                   headers: List[str],
+                   idx: Dict[str, int]) -> ExternalTxn:
+        """Parse bank-specific CSV format.
+
+        Raises on malformed data; _iter_parsed attaches the row number.
+        """
+        # Handle different date formats
+        date_str = row[idx['date']].strip()
+        timestamp = self._parse_timestamp(date_str)
+
+        # Handle negative amounts (debits)
+        amount_str = row[idx['amount']].strip().translate(_AMOUNT_STRIP)
+        amount = abs(_cached_decimal(amount_str))  # Take absolute value
+
+        return ExternalTxn.model_construct(
+            txn_id=row[idx['transaction_id']].strip(),
+            amount=amount,
+            currency=_intern_ccy(row[idx['currency']].strip().upper()),
+            timestamp=timestamp,
+            description=row[idx['description']].strip() or None,
+            metadata={
+                'source_format': 'bank_csv',
+                'original_amount': amount_str
+            }
+        )
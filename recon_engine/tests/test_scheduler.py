@@ -0,0 +1,103 @@
+"""
+Tests for the reconciliation scheduler.
+Verifies the scheduler drives the real ReconEngine.run signature and
+manages the recon_runs claim correctly on success and failure.
+"""
+
+import inspect
+import sys
+import types
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+# The ledger app ships in a separate tree; the scheduler only needs the
+# db_manager symbol at import time and these tests never touch the pool
+try:
+    import app.database.connection  # noqa: F401
+except ModuleNotFoundError:
+    app_pkg = types.ModuleType('app')
+    db_pkg = types.ModuleType('app.database')
+    conn_mod = types.ModuleType('app.database.connection')
+    conn_mod.db_manager = MagicMock()
+    app_pkg.database = db_pkg
+    db_pkg.connection = conn_mod
+    sys.modules['app'] = app_pkg
+    sys.modules['app.database'] = db_pkg
+    sys.modules['app.database.connection'] = conn_mod
+
+from recon_engine.jobs.recon_scheduler import ReconScheduler
+from recon_engine.recon.recon_engine import ReconEngine
+
+
+def _make_engine_run_stub(calls, error=None):
+    """Stub with the real ReconEngine.run signature.
+
+    Keeping the parameters identical to the real method means a drift
+    in how the scheduler calls run() raises TypeError here instead of
+    being swallowed by the scheduler's exception handler in production.
+    """
+    async def run(target_date, source_name, **kwargs):
+        calls.append((target_date, source_name, kwargs))
+        if error is not None:
+            raise error
+        return uuid4()
+
+    stub_params = list(inspect.signature(run).parameters)
+    real_params = [
+        name for name in inspect.signature(ReconEngine.run).parameters
+        if name != 'self'
+    ]
+    assert stub_params == real_params, "stub drifted from ReconEngine.run"
+    return run
+
+
+class TestReconScheduler:
+    """Test suite for ReconScheduler"""
+
+    @pytest.mark.asyncio
+    async def test_run_recon_for_source_calls_engine_with_real_signature(self):
+        """Scheduler invokes ReconEngine.run so the real signature accepts it"""
+        scheduler = ReconScheduler()
+        calls = []
+        scheduler.recon_engine.run = _make_engine_run_stub(calls)
+        scheduler._claim_run = AsyncMock(return_value=True)
+        scheduler._release_run = AsyncMock()
+
+        await scheduler._run_recon_for_source("bank_csv")
+
+        assert calls == [(date.today(), "bank_csv", {})]
+        # Successful runs keep the claim so the day is not re-run
+        scheduler._release_run.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_run_recon_for_source_releases_claim_on_failure(self):
+        """A failed run releases the claim so a later cycle retries"""
+        scheduler = ReconScheduler()
+        calls = []
+        scheduler.recon_engine.run = _make_engine_run_stub(
+            calls, error=RuntimeError("source unavailable")
+        )
+        scheduler._claim_run = AsyncMock(return_value=True)
+        scheduler._release_run = AsyncMock()
+
+        await scheduler._run_recon_for_source("bank_csv")
+
+        assert len(calls) == 1
+        scheduler._release_run.assert_awaited_once_with("bank_csv", date.today())
+
+    @pytest.mark.asyncio
+    async def test_run_recon_for_source_skips_when_already_claimed(self):
+        """An already-claimed slot skips the engine entirely"""
+        scheduler = ReconScheduler()
+        calls = []
+        scheduler.recon_engine.run = _make_engine_run_stub(calls)
+        scheduler._claim_run = AsyncMock(return_value=False)
+        scheduler._release_run = AsyncMock()
+
+        await scheduler._run_recon_for_source("bank_csv")
+
+        assert calls == []
+        scheduler._release_run.assert_not_awaited()